@@ -6,6 +6,8 @@ This script validates that the multi-collection support is working correctly
 without actually generating embeddings (to avoid API costs).
 """
 
+import functools
+import os
 import sys
 from pathlib import Path
 
@@ -62,8 +64,9 @@ def test_verse_directories(collections_file, base_verses_dir):
             verses_dir = base_verses_dir / subdirectory
 
             if verses_dir.exists():
-                verse_files = list(verses_dir.glob("*.md"))
-                print(f"✓ {key}: {len(verse_files)} files in {verses_dir}")
+                with os.scandir(verses_dir) as entries:
+                    count = sum(1 for e in entries if e.name.endswith(".md") and e.is_file())
+                print(f"✓ {key}: {count} files in {verses_dir}")
             else:
                 print(f"✗ {key}: Directory not found - {verses_dir}")
                 all_exist = False
@@ -82,11 +85,17 @@ def test_permalink_extraction(base_verses_dir):
 
     # Find sample verse files from different collections
     test_files = []
-    for subdir in base_verses_dir.iterdir():
-        if subdir.is_dir():
-            md_files = list(subdir.glob("*.md"))
-            if md_files:
-                test_files.append(md_files[0])  # Take first file from each collection
+    top_level = True
+    for dirpath, dirnames, filenames in os.walk(base_verses_dir):
+        if top_level:
+            # Only collection subdirectories hold verses
+            top_level = False
+            continue
+        dirnames.clear()  # Don't descend below collection directories
+        # Take first file from each collection
+        first_md = next((name for name in filenames if name.endswith(".md")), None)
+        if first_md:
+            test_files.append(Path(dirpath) / first_md)
 
     if not test_files:
         print("✗ No verse files found to test")
@@ -112,10 +121,11 @@ def test_permalink_extraction(base_verses_dir):
             print(f"  Permalink (from frontmatter): {permalink}")
             print(f"  Generated URL (fallback): {generated_url}")
 
+            verse_url = permalink or generated_url
             if permalink:
-                print(f"  ✓ Will use permalink from frontmatter")
+                print(f"  ✓ Will use permalink from frontmatter: {verse_url}")
             else:
-                print(f"  ⚠ Will use generated URL (no permalink in frontmatter)")
+                print(f"  ⚠ Will use generated URL (no permalink in frontmatter): {verse_url}")
 
         except Exception as e:
             print(f"✗ Error processing {test_file.name}: {e}")
@@ -163,24 +173,43 @@ def test_collection_metadata():
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _test_env():
+    """Resolve test data locations once, probing the filesystem a single time."""
+    # Try to find test data in the hanuman-chalisa project
+    hanuman_project = Path.home() / "workspaces" / "hanuman-chalisa"
+    if os.path.exists(str(hanuman_project)):
+        collections_file = hanuman_project / "_data" / "collections.yml"
+        base_verses_dir = hanuman_project / "_verses"
+        available = True
+    else:
+        collections_file = Path("collections.yml")
+        base_verses_dir = Path("_verses")
+        available = False
+
+    return {
+        "project": hanuman_project,
+        "available": available,
+        "collections": collections_file,
+        "verses": base_verses_dir,
+        "collections_exists": os.path.exists(str(collections_file)),
+        "verses_exists": os.path.exists(str(base_verses_dir)),
+    }
+
+
 def main():
     """Run all tests"""
     print("Multi-Collection Embeddings Test Suite")
     print("=" * 70)
 
-    # Configuration
-    # Try to find test data in the hanuman-chalisa project
-    hanuman_project = Path.home() / "workspaces" / "hanuman-chalisa"
-
-    if hanuman_project.exists():
-        collections_file = hanuman_project / "_data" / "collections.yml"
-        base_verses_dir = hanuman_project / "_verses"
-        print(f"Using test data from: {hanuman_project}")
+    env = _test_env()
+    collections_file = env["collections"]
+    base_verses_dir = env["verses"]
+    if env["available"]:
+        print(f"Using test data from: {env['project']}")
     else:
         print("Note: hanuman-chalisa project not found at expected location")
         print("Using minimal test configuration")
-        collections_file = Path("collections.yml")
-        base_verses_dir = Path("_verses")
 
     print(f"Collections file: {collections_file}")
     print(f"Verses directory: {base_verses_dir}")
@@ -189,11 +218,11 @@ def main():
     # Run tests
     results = []
 
-    if collections_file.exists():
+    if env["collections_exists"]:
         results.append(("Collections Loading", test_collections_loading(collections_file)))
         results.append(("Verse Directories", test_verse_directories(collections_file, base_verses_dir)))
 
-        if base_verses_dir.exists():
+        if env["verses_exists"]:
             results.append(("Permalink Extraction", test_permalink_extraction(base_verses_dir)))
     else:
         print(f"⚠ Collections file not found: {collections_file}")
@@ -43,6 +43,12 @@ setup(
         "pdfplumber>=0.10.0",
         "numpy>=1.24.0",
     ],
+    extras_require={
+        # SIMD cosine kernels for Puranic episode retrieval
+        "simd": ["simsimd>=4.0.0"],
+        # Faster JSON decoding for embeddings and data files
+        "json": ["orjson>=3.9.0"],
+    },
     entry_points={
         'console_scripts': [
             'verse-generate=verse_sdk.cli.generate:main',
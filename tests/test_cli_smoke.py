@@ -1,115 +1,50 @@
 """Smoke tests — verify CLI entry points load and respond to --help."""
 
-import subprocess
+import contextlib
+import importlib
+import io
 import sys
 
-COMMANDS = [
-    "verse-generate",
-    "verse-embeddings",
-    "verse-audio",
-    "verse-images",
-    "verse-status",
-    "verse-sync",
-    "verse-translate",
-    "verse-init",
-    "verse-validate",
-    "verse-add",
-    "verse-puranic-context",
-    "verse-index-sources",
-    "verse-help",
-]
-
-
-def _run(cmd, *args):
-    return subprocess.run(
-        [sys.executable, "-m", "verse_sdk.cli." + cmd.replace("verse-", "").replace("-", "_"), *args],
-        capture_output=True,
-        text=True,
-    )
-
-
-def _run_entry(cmd, *args):
-    """Run via the installed entry point script name."""
-    return subprocess.run(
-        [cmd, *args],
-        capture_output=True,
-        text=True,
-    )
-
+import pytest
 
 # ---------------------------------------------------------------------------
 # Module import smoke tests (no API calls, no file system)
 # ---------------------------------------------------------------------------
 
-def test_import_puranic_context():
-    import verse_sdk.cli.puranic_context  # noqa: F401
-
-
-def test_import_index_sources():
-    import verse_sdk.cli.index_sources  # noqa: F401
-
-
-def test_import_validate():
-    import verse_sdk.cli.validate  # noqa: F401
-
-
-def test_import_init():
-    import verse_sdk.cli.init  # noqa: F401
-
-
-def test_import_help():
-    import verse_sdk.cli.help  # noqa: F401
-
-
-def test_import_generate():
-    import verse_sdk.cli.generate  # noqa: F401
-
-
-def test_import_status():
-    import verse_sdk.cli.status  # noqa: F401
-
-
-def test_import_sync():
-    import verse_sdk.cli.sync  # noqa: F401
-
-
-def test_import_translate():
-    import verse_sdk.cli.translate  # noqa: F401
-
-
-def test_import_add():
-    import verse_sdk.cli.add  # noqa: F401
-
-
-def test_import_generate_embeddings():
-    import verse_sdk.embeddings.generate_embeddings  # noqa: F401
-
-
-def test_import_local_embeddings():
-    import verse_sdk.embeddings.local_embeddings  # noqa: F401
-
-
-def test_import_file_utils():
-    import verse_sdk.utils.file_utils  # noqa: F401
-
-
-def test_import_yaml_parser():
-    import verse_sdk.utils.yaml_parser  # noqa: F401
+@pytest.mark.parametrize("module_path", [
+    "verse_sdk.cli.puranic_context",
+    "verse_sdk.cli.index_sources",
+    "verse_sdk.cli.validate",
+    "verse_sdk.cli.init",
+    "verse_sdk.cli.help",
+    "verse_sdk.cli.generate",
+    "verse_sdk.cli.status",
+    "verse_sdk.cli.sync",
+    "verse_sdk.cli.translate",
+    "verse_sdk.cli.add",
+    "verse_sdk.embeddings.generate_embeddings",
+    "verse_sdk.embeddings.local_embeddings",
+    "verse_sdk.utils.file_utils",
+    "verse_sdk.utils.yaml_parser",
+])
+def test_import(module_path):
+    importlib.import_module(module_path)
 
 
 # ---------------------------------------------------------------------------
 # --help exits 0 (argparse commands)
 # ---------------------------------------------------------------------------
 
-def _help_exits_zero(module_path):
-    result = subprocess.run(
-        [sys.executable, "-c", f"import sys; sys.argv=['cmd','--help']; from {module_path} import main; main()"],
-        capture_output=True,
-        text=True,
-    )
+def _help_exits_zero(module_path, prog="cmd"):
+    mod = importlib.import_module(module_path)
+    buf = io.StringIO()
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(sys, "argv", [prog, "--help"])
+        with contextlib.redirect_stdout(buf), pytest.raises(SystemExit) as exc:
+            mod.main()
     # argparse --help exits with code 0
-    assert result.returncode == 0, f"{module_path} --help failed:\n{result.stderr}"
-    assert "usage" in result.stdout.lower() or "Usage" in result.stdout
+    assert exc.value.code == 0, f"{module_path} --help exited with {exc.value.code}"
+    assert "usage" in buf.getvalue().lower()
 
 
 def test_help_verse_init():
@@ -153,29 +88,20 @@ def test_help_verse_parse_source():
 
 
 def test_help_verse_deploy():
-    result = subprocess.run(
-        [sys.executable, "-c", "import sys; sys.argv=['verse-deploy','--help']; from verse_sdk.deployment.deploy import main; main()"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, f"verse-deploy --help failed:\n{result.stderr}"
-    assert "usage" in result.stdout.lower()
+    _help_exits_zero("verse_sdk.deployment.deploy", prog="verse-deploy")
 
 
 # ---------------------------------------------------------------------------
 # verse-init functional smoke test
 # ---------------------------------------------------------------------------
 
-def test_verse_init_creates_structure(tmp_path):
-    result = subprocess.run(
-        [sys.executable, "-c",
-         f"import sys; sys.argv=['verse-init','--project-name','testproj']; "
-         f"import os; os.chdir('{tmp_path}'); "
-         f"from verse_sdk.cli.init import main; main()"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, result.stderr
+def test_verse_init_creates_structure(tmp_path, monkeypatch):
+    from verse_sdk.cli.init import main
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(sys, "argv", ["verse-init", "--project-name", "testproj"])
+    main()
     project = tmp_path / "testproj"
     assert project.is_dir()
     assert (project / "_data" / "collections.yml").exists()
@@ -183,15 +109,14 @@ def test_verse_init_creates_structure(tmp_path):
     assert (project / ".env.example").exists()
 
 
-def test_verse_init_with_collection(tmp_path):
-    result = subprocess.run(
-        [sys.executable, "-c",
-         f"import sys; sys.argv=['verse-init','--project-name','myproj','--collection','hanuman-chalisa']; "
-         f"import os; os.chdir('{tmp_path}'); "
-         f"from verse_sdk.cli.init import main; main()"],
-        capture_output=True,
-        text=True,
+def test_verse_init_with_collection(tmp_path, monkeypatch):
+    from verse_sdk.cli.init import main
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(
+        sys, "argv", ["verse-init", "--project-name", "myproj", "--collection", "hanuman-chalisa"]
     )
-    assert result.returncode == 0, result.stderr
+    main()
     assert (tmp_path / "myproj" / "_verses" / "hanuman-chalisa").is_dir()
     assert (tmp_path / "myproj" / "data" / "verses" / "hanuman-chalisa.yaml").exists()
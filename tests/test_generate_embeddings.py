@@ -0,0 +1,67 @@
+"""Tests for the collections.yml loader in verse_sdk/embeddings/generate_embeddings.py."""
+
+import importlib
+import json
+
+import pytest
+
+# The package re-exports a function with the module's name, so import the module explicitly
+ge = importlib.import_module("verse_sdk.embeddings.generate_embeddings")
+
+
+@pytest.fixture
+def collections_file(tmp_path):
+    data_dir = tmp_path / "_data"
+    data_dir.mkdir()
+    path = data_dir / "collections.yml"
+    path.write_text("hanuman-chalisa:\n  enabled: true\n  name_en: Hanuman Chalisa\n")
+    return path
+
+
+def _sidecar(path):
+    return path.parent / ".collections.yml.json"
+
+
+def test_sidecar_not_written_by_default(collections_file, monkeypatch):
+    monkeypatch.delenv("EMBEDDINGS_COLLECTIONS_CACHE", raising=False)
+    assert ge.load_collections_config(collections_file)["hanuman-chalisa"]["enabled"] is True
+    assert not _sidecar(collections_file).exists()
+
+
+def test_sidecar_round_trip(collections_file, monkeypatch):
+    monkeypatch.setenv("EMBEDDINGS_COLLECTIONS_CACHE", "1")
+    config = ge.load_collections_config(collections_file)
+    cached = json.loads(_sidecar(collections_file).read_text(encoding="utf-8"))
+    assert cached["data"] == config
+    assert cached["size"] == collections_file.stat().st_size
+    assert not [p for p in collections_file.parent.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_sidecar_ignored_when_stale(collections_file, monkeypatch):
+    monkeypatch.setenv("EMBEDDINGS_COLLECTIONS_CACHE", "1")
+    st = collections_file.stat()
+    path = str(collections_file.resolve())
+    _sidecar(collections_file).write_text(json.dumps(
+        {"mtime_ns": st.st_mtime_ns - 1, "size": st.st_size, "data": {"stale": {}}}
+    ))
+    assert ge._read_collections_sidecar(path, st.st_mtime_ns, st.st_size) is None
+    assert "hanuman-chalisa" in ge.load_collections_config(collections_file)
+
+
+def test_sidecar_skipped_for_yaml_only_types(collections_file, monkeypatch):
+    monkeypatch.setenv("EMBEDDINGS_COLLECTIONS_CACHE", "1")
+    collections_file.write_text("hanuman-chalisa:\n  added: 2024-01-01\n")
+    assert ge.load_collections_config(collections_file)["hanuman-chalisa"]["added"].year == 2024
+    assert not _sidecar(collections_file).exists()
+
+
+def test_sidecar_write_failure_is_ignored(collections_file, monkeypatch):
+    monkeypatch.setenv("EMBEDDINGS_COLLECTIONS_CACHE", "1")
+
+    def read_only_replace(src, dst):
+        raise PermissionError(dst)
+
+    monkeypatch.setattr(ge.os, "replace", read_only_replace)
+    assert "hanuman-chalisa" in ge.load_collections_config(collections_file)
+    assert not _sidecar(collections_file).exists()
+    assert not [p for p in collections_file.parent.iterdir() if p.name.endswith(".tmp")]
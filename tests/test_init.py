@@ -1,8 +1,11 @@
 """Tests for verse_sdk/cli/init.py — project scaffolding."""
 
+import os
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from verse_sdk.cli.init import (
     create_directory_structure,
     create_example_collection,
@@ -15,26 +18,52 @@ from verse_sdk.cli.init import (
     main as init_main,
 )
 
+
+@pytest.fixture(scope="module")
+def scaffolded(tmp_path_factory):
+    """One scaffolded project shared by tests that only read the generated files."""
+    project = tmp_path_factory.mktemp("proj")
+    with pytest.MonkeyPatch.context() as m:
+        # Keep create_example_collection from shelling out to verse-images
+        m.delenv("OPENAI_API_KEY", raising=False)
+        create_directory_structure(project)
+        create_template_files(project, "my-project")
+        create_example_collection(project, "hanuman-chalisa", num_verses=5)
+    return project
+
+
 # ---------------------------------------------------------------------------
 # create_directory_structure
 # ---------------------------------------------------------------------------
 
+def _subdir_names(path):
+    """Names of the directories directly under path, from a single readdir."""
+    with os.scandir(path) as entries:
+        return {e.name for e in entries if e.is_dir()}
+
+
 def test_creates_required_dirs(tmp_path):
     create_directory_structure(tmp_path)
-    for d in ["_data", "_layouts", "_verses", "data/themes", "data/verses", "data/scenes"]:
-        assert (tmp_path / d).is_dir(), f"Missing required dir: {d}"
+    top_level = _subdir_names(tmp_path)
+    data_dirs = _subdir_names(tmp_path / "data")
+    for d in ["_data", "_layouts", "_verses", "data"]:
+        assert d in top_level, f"Missing required dir: {d}"
+    for d in ["themes", "verses", "scenes"]:
+        assert d in data_dirs, f"Missing required dir: data/{d}"
 
 
 def test_creates_optional_dirs_by_default(tmp_path):
     create_directory_structure(tmp_path, minimal=False)
+    base = str(tmp_path)
     for d in ["images", "audio", "data/sources", "data/puranic-index", "data/embeddings"]:
-        assert (tmp_path / d).is_dir(), f"Missing optional dir: {d}"
+        assert os.path.isdir(os.path.join(base, d)), f"Missing optional dir: {d}"
 
 
 def test_minimal_skips_optional_dirs(tmp_path):
     create_directory_structure(tmp_path, minimal=True)
+    base = str(tmp_path)
     for d in ["images", "audio", "data/sources", "data/puranic-index", "data/embeddings"]:
-        assert not (tmp_path / d).exists(), f"Unexpected dir in minimal mode: {d}"
+        assert not os.path.exists(os.path.join(base, d)), f"Unexpected dir in minimal mode: {d}"
 
 
 def test_idempotent(tmp_path):
@@ -46,9 +75,8 @@ def test_idempotent(tmp_path):
 # create_template_files
 # ---------------------------------------------------------------------------
 
-def test_creates_required_files(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
+def test_creates_required_files(scaffolded):
+    base = str(scaffolded)
     for f in [
         ".env.example",
         "_data/collections.yml",
@@ -71,7 +99,7 @@ def test_creates_required_files(tmp_path):
         "index.html",
         "README.md",
     ]:
-        assert (tmp_path / f).exists(), f"Missing file: {f}"
+        assert os.path.exists(os.path.join(base, f)), f"Missing file: {f}"
 
 
 def test_readme_contains_project_name(tmp_path):
@@ -89,41 +117,36 @@ def test_does_not_overwrite_existing_files(tmp_path):
     assert readme.read_text() == "original content"
 
 
-def test_verse_config_contains_defaults_section(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / "_data" / "verse-config.yml").read_text()
+def test_verse_config_contains_defaults_section(scaffolded):
+    content = (scaffolded / "_data" / "verse-config.yml").read_text()
     assert "defaults" in content
 
 
-def test_gitignore_excludes_env(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / ".gitignore").read_text()
+def test_gitignore_excludes_env(scaffolded):
+    content = (scaffolded / ".gitignore").read_text()
     assert ".env" in content
 
 
-def test_env_example_includes_hf_token(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / ".env.example").read_text()
+def test_gitignore_excludes_response_cache(scaffolded):
+    content = (scaffolded / ".gitignore").read_text()
+    assert ".cache/" in content.splitlines()
+
+
+def test_env_example_includes_hf_token(scaffolded):
+    content = (scaffolded / ".env.example").read_text()
     assert "HF_TOKEN=" in content
     assert "https://huggingface.co/settings/tokens" in content
 
 
-def test_gemfile_includes_jekyll(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / "Gemfile").read_text()
+def test_gemfile_includes_jekyll(scaffolded):
+    content = (scaffolded / "Gemfile").read_text()
     assert 'gem "jekyll"' in content
     assert 'gem "jekyll-seo-tag"' in content
     assert 'gem "minima"' not in content
 
 
-def test_config_does_not_reference_minima(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / "_config.yml").read_text()
+def test_config_does_not_reference_minima(scaffolded):
+    content = (scaffolded / "_config.yml").read_text()
     assert "theme: minima" not in content
     assert "collections:" in content
     assert "verses:" in content
@@ -167,10 +190,8 @@ def test_normalize_repo_url_handles_https_and_ssh():
     assert normalize_repo_url("https://github.com/org/repo") == "https://github.com/org/repo"
 
 
-def test_index_page_has_jekyll_frontmatter(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "my-project")
-    content = (tmp_path / "index.html").read_text()
+def test_index_page_has_jekyll_frontmatter(scaffolded):
+    content = (scaffolded / "index.html").read_text()
     assert content.startswith("---\n")
     assert "layout: home" in content
     assert "site.data.collections" in content
@@ -189,37 +210,26 @@ def test_index_page_has_jekyll_frontmatter(tmp_path):
 # create_example_collection
 # ---------------------------------------------------------------------------
 
-def test_does_not_create_sample_verse_markdown_files(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    create_example_collection(tmp_path, "hanuman-chalisa", num_verses=3)
+def test_does_not_create_sample_verse_markdown_files(scaffolded):
+    entries = set(os.listdir(scaffolded / "_verses" / "hanuman-chalisa"))
     for i in range(1, 4):
-        f = tmp_path / "_verses" / "hanuman-chalisa" / f"verse-{i:02d}.md"
-        assert not f.exists(), f"Unexpected sample verse markdown: {f.name}"
+        name = f"verse-{i:02d}.md"
+        assert name not in entries, f"Unexpected sample verse markdown: {name}"
 
 
-def test_creates_canonical_yaml(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    create_example_collection(tmp_path, "hanuman-chalisa", num_verses=2)
-    yaml_file = tmp_path / "data" / "verses" / "hanuman-chalisa.yaml"
+def test_creates_canonical_yaml(scaffolded):
+    yaml_file = scaffolded / "data" / "verses" / "hanuman-chalisa.yaml"
     assert yaml_file.exists()
     assert "hanuman-chalisa" in yaml_file.read_text()
 
 
-def test_creates_theme_file(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    create_example_collection(tmp_path, "hanuman-chalisa", num_verses=1)
-    theme = tmp_path / "data" / "themes" / "hanuman-chalisa" / "modern-minimalist.yml"
+def test_creates_theme_file(scaffolded):
+    theme = scaffolded / "data" / "themes" / "hanuman-chalisa" / "modern-minimalist.yml"
     assert theme.exists()
 
 
-def test_creates_scenes_file(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    create_example_collection(tmp_path, "hanuman-chalisa", num_verses=2)
-    scenes = tmp_path / "data" / "scenes" / "hanuman-chalisa.yml"
+def test_creates_scenes_file(scaffolded):
+    scenes = scaffolded / "data" / "scenes" / "hanuman-chalisa.yml"
     assert scenes.exists()
     content = scenes.read_text()
     assert "cover:" in content
@@ -229,10 +239,8 @@ def test_creates_scenes_file(tmp_path):
     assert "verse-01:" not in content
 
 
-def test_creates_site_scenes_file(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    site_scenes = tmp_path / "data" / "scenes" / "site.yml"
+def test_creates_site_scenes_file(scaffolded):
+    site_scenes = scaffolded / "data" / "scenes" / "site.yml"
     assert site_scenes.exists()
     content = site_scenes.read_text()
     assert "scenes:" in content
@@ -249,11 +257,8 @@ def test_scenes_file_is_collection_aware_for_shiva(tmp_path):
     assert "Kailash-inspired" in content
 
 
-def test_creates_source_text_placeholder_file(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    create_example_collection(tmp_path, "hanuman-chalisa", num_verses=2)
-    source = tmp_path / "data" / "sources" / "hanuman-chalisa.txt"
+def test_creates_source_text_placeholder_file(scaffolded):
+    source = scaffolded / "data" / "sources" / "hanuman-chalisa.txt"
     assert source.exists()
     assert "verse-parse-source --collection hanuman-chalisa" in source.read_text()
 
@@ -350,11 +355,8 @@ def test_reports_images_pending_when_api_key_missing(tmp_path, monkeypatch, caps
     assert "verse-images --collection shiv-puran --theme modern-minimalist --verse cover" in out
 
 
-def test_collection_layout_references_title_image(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-
-    index_content = (tmp_path / "index.html").read_text()
+def test_collection_layout_references_title_image(scaffolded):
+    index_content = (scaffolded / "index.html").read_text()
     assert "{% assign theme_name = cfg.image_theme | default: cfg.theme | default: cfg.default_theme" in index_content
     assert "{% assign generated_count = 0 %}" in index_content
     assert "/images/{{ key }}/{{ theme_name }}/cover.png" in index_content
@@ -363,7 +365,7 @@ def test_collection_layout_references_title_image(tmp_path):
     assert "this.src='/images/{{ key }}/card.png'" not in index_content
     assert "class=\"collection-card card\"" in index_content
 
-    layout = (tmp_path / "_layouts" / "collection.html").read_text()
+    layout = (scaffolded / "_layouts" / "collection.html").read_text()
     assert "{% assign theme_name = collection_cfg.image_theme | default: collection_cfg.theme | default: collection_cfg.default_theme" in layout
     assert "/images/{{ collection_key }}/{{ theme_name }}/cover.png" in layout
     assert "this.src='/images/{{ collection_key }}/title.png'" not in layout
@@ -381,10 +383,8 @@ def test_collection_layout_references_title_image(tmp_path):
     assert "v.path contains" not in layout
 
 
-def test_index_layout_orders_hero_then_sacred_text(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    content = (tmp_path / "index.html").read_text()
+def test_index_layout_orders_hero_then_sacred_text(scaffolded):
+    content = (scaffolded / "index.html").read_text()
     assert content.index("home-hero") < content.index("Sacred Text")
     assert "/images/cover.png" in content
 
@@ -419,10 +419,8 @@ def test_resolve_collection_theme_prefers_collection_override(tmp_path):
     assert resolve_collection_theme(tmp_path, "shiv-puran") == "temple-art"
 
 
-def test_default_layout_uses_assets_and_configurable_header(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    layout = (tmp_path / "_layouts" / "default.html").read_text()
+def test_default_layout_uses_assets_and_configurable_header(scaffolded):
+    layout = (scaffolded / "_layouts" / "default.html").read_text()
     assert "/assets/css/style.css" in layout
     assert "/assets/css/print.css" in layout
     assert "/assets/js/navigation.js" in layout
@@ -447,11 +445,11 @@ def test_default_layout_uses_assets_and_configurable_header(tmp_path):
     assert "Contribute" in layout
     assert "sanatan-learnings/sanatan-verse-sdk" not in layout
 
-    css = (tmp_path / "assets" / "css" / "style.css").read_text()
+    css = (scaffolded / "assets" / "css" / "style.css").read_text()
     assert "body.banner-theme-shiva" in css
     assert ".site-footer" in css
 
-    config = (tmp_path / "_config.yml").read_text()
+    config = (scaffolded / "_config.yml").read_text()
     assert "project_repository_url:" in config
     assert "usage_guide_url:" in config
     assert "ask_shiva_url:" in config
@@ -459,10 +457,8 @@ def test_default_layout_uses_assets_and_configurable_header(tmp_path):
     assert "contribute_url:" in config
 
 
-def test_home_layout_does_not_duplicate_title_and_description(tmp_path):
-    create_directory_structure(tmp_path)
-    create_template_files(tmp_path, "test")
-    layout = (tmp_path / "_layouts" / "home.html").read_text()
+def test_home_layout_does_not_duplicate_title_and_description(scaffolded):
+    layout = (scaffolded / "_layouts" / "home.html").read_text()
     assert "{{ page.title | default: site.title }}" not in layout
     assert "{{ site.description }}" not in layout
 
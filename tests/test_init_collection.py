@@ -1,16 +1,20 @@
 """Tests for verse_sdk/cli/init_collection.py."""
 
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
 from verse_sdk.cli.init_collection import (
     _about_paragraphs,
     _about_section,
+    _individual_section,
     detect_sections,
     generate_full_text_html,
     generate_index_html,
     scaffold_collection,
+    scaffold_many,
 )
 
 # ---------------------------------------------------------------------------
@@ -20,7 +24,7 @@ from verse_sdk.cli.init_collection import (
 def _make_verses(verses_dir: Path, *stems: str):
     verses_dir.mkdir(parents=True, exist_ok=True)
     for stem in stems:
-        (verses_dir / f"{stem}.md").write_text(f"---\nverse_id: {stem}\n---\n")
+        (verses_dir / f"{stem}.md").write_bytes(b"---\nverse_id: " + stem.encode() + b"\n---\n")
 
 
 def _make_collections_yml(project_dir: Path, key: str, **extra):
@@ -39,6 +43,20 @@ def _make_collections_yml(project_dir: Path, key: str, **extra):
     return config
 
 
+@pytest.fixture(scope="session")
+def prebuilt_collection(tmp_path_factory):
+    """Read-only project skeleton shared by tests that never write into it."""
+    root = tmp_path_factory.mktemp("shared")
+    _make_collections_yml(root, "bajrang-baan")
+    _make_verses(root / "_verses" / "bajrang-baan",
+                 "doha-opening",
+                 "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04",
+                 "doha-closing")
+    _make_verses(root / "_verses" / "chaupai-only",
+                 "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04", "chaupai-05")
+    return root
+
+
 # ---------------------------------------------------------------------------
 # detect_sections
 # ---------------------------------------------------------------------------
@@ -48,9 +66,26 @@ def test_detect_sections_empty_dir(tmp_path):
     assert result == []
 
 
-def test_detect_sections_single_type(tmp_path):
-    verses_dir = tmp_path / "_verses" / "test"
-    _make_verses(verses_dir, "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04", "chaupai-05")
+def test_detect_sections_path_is_a_file(tmp_path):
+    not_a_dir = tmp_path / "bajrang-baan"
+    not_a_dir.write_text("")
+    assert detect_sections(not_a_dir) == []
+
+
+def test_detect_sections_sees_verses_added_within_same_mtime(tmp_path):
+    verses_dir = tmp_path / "bajrang-baan"
+    _make_verses(verses_dir, "chaupai-01")
+    st = verses_dir.stat()
+    assert len(detect_sections(verses_dir)[0]["verse_ids"]) == 1
+
+    # Coarse-mtime filesystems can report the same directory mtime after an add
+    _make_verses(verses_dir, "chaupai-02")
+    os.utime(verses_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert len(detect_sections(verses_dir)[0]["verse_ids"]) == 2
+
+
+def test_detect_sections_single_type(prebuilt_collection):
+    verses_dir = prebuilt_collection / "_verses" / "chaupai-only"
     sections = detect_sections(verses_dir)
     assert len(sections) == 1
     assert sections[0]["prefix"] == "chaupai"
@@ -71,12 +106,8 @@ def test_detect_sections_loop_threshold(tmp_path):
     assert sections2[0]["is_loop"] is True
 
 
-def test_detect_sections_multiple_types_with_sequence(tmp_path):
-    verses_dir = tmp_path / "_verses" / "test"
-    _make_verses(verses_dir,
-                 "doha-opening",
-                 "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04",
-                 "doha-closing")
+def test_detect_sections_multiple_types_with_sequence(prebuilt_collection):
+    verses_dir = prebuilt_collection / "_verses" / "bajrang-baan"
     sequence = ["doha-opening", "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04", "doha-closing"]
     sections = detect_sections(verses_dir, sequence=sequence)
     assert len(sections) == 3
@@ -88,13 +119,9 @@ def test_detect_sections_multiple_types_with_sequence(tmp_path):
     assert sections[2]["verse_ids"] == ["doha-closing"]
 
 
-def test_detect_sections_multiple_types_alpha_fallback(tmp_path):
+def test_detect_sections_multiple_types_alpha_fallback(prebuilt_collection):
     """Without a sequence, alphabetical sort merges both doha groups."""
-    verses_dir = tmp_path / "_verses" / "test"
-    _make_verses(verses_dir,
-                 "doha-opening",
-                 "chaupai-01", "chaupai-02", "chaupai-03", "chaupai-04",
-                 "doha-closing")
+    verses_dir = prebuilt_collection / "_verses" / "bajrang-baan"
     sections = detect_sections(verses_dir)  # no sequence
     # Alphabetical: chaupai-* < doha-closing < doha-opening → 2 sections
     assert len(sections) == 2
@@ -169,6 +196,20 @@ def test_generate_individual_section_contains_verse_ids():
     assert "has-puranic-context" in html
 
 
+def test_detect_sections_records_suffixes(prebuilt_collection):
+    verses_dir = prebuilt_collection / "_verses" / "bajrang-baan"
+    sections = detect_sections(verses_dir)
+    assert sections[1]["suffixes"] == ["closing", "opening"]
+
+
+def test_individual_section_uses_precomputed_suffixes():
+    # A suffix that disagrees with the id shows the precomputed one was used
+    html = _individual_section(["doha-x"], "test", "📿", "Doha", "दोहा", suffixes=["7"])
+    assert "Doha 7" in html
+    assert "X Doha" not in html
+    assert "X Doha" in _individual_section(["doha-x"], "test", "📿", "Doha", "दोहा")
+
+
 def test_generate_layout_frontmatter():
     config = {"name_en": "Test", "permalink_base": "/test/"}
     html = generate_index_html("test", config, [])
@@ -358,12 +399,44 @@ def test_scaffold_overwrites_with_flag(tmp_path):
     assert output.read_text() != "original"
 
 
-def test_scaffold_unknown_collection_returns_false(tmp_path):
-    _make_collections_yml(tmp_path, "real-collection")
-    result = scaffold_collection("nonexistent", tmp_path)
+def _failing_render(*args, **kwargs):
+    raise RuntimeError("render failed")
+
+
+def test_scaffold_render_failure_leaves_no_stub(tmp_path, monkeypatch):
+    key = "test-col"
+    _make_collections_yml(tmp_path, key)
+    monkeypatch.setattr("verse_sdk.cli.init_collection.generate_index_html", _failing_render)
+    with pytest.raises(RuntimeError):
+        scaffold_collection(key, tmp_path)
+    assert not (tmp_path / key / "index.html").exists()
+
+
+def test_scaffold_render_failure_keeps_page_when_overwriting(tmp_path, monkeypatch):
+    key = "test-col"
+    _make_collections_yml(tmp_path, key)
+    output = tmp_path / key / "index.html"
+    output.parent.mkdir(parents=True)
+    output.write_text("original")
+    monkeypatch.setattr("verse_sdk.cli.init_collection.generate_index_html", _failing_render)
+    with pytest.raises(RuntimeError):
+        scaffold_collection(key, tmp_path, overwrite=True)
+    assert output.read_text() == "original"
+    assert [p.name for p in output.parent.iterdir()] == ["index.html"]
+
+
+def test_scaffold_unknown_collection_returns_false(prebuilt_collection):
+    result = scaffold_collection("nonexistent", prebuilt_collection)
     assert result is False
 
 
+def test_scaffold_unknown_collection_recovers_after_yml_edit(tmp_path):
+    _make_collections_yml(tmp_path, "real-collection")
+    assert scaffold_collection("added-later", tmp_path) is False
+    _make_collections_yml(tmp_path, "added-later")
+    assert scaffold_collection("added-later", tmp_path) is True
+
+
 def test_scaffold_respects_canonical_sequence(tmp_path):
     key = "bajrang-baan"
     _make_collections_yml(tmp_path, key)
@@ -393,3 +466,37 @@ def test_scaffold_creates_parent_dir(tmp_path):
     assert not output.parent.exists()
     scaffold_collection(key, tmp_path)
     assert output.exists()
+
+
+def test_scaffold_many_writes_each_collection(tmp_path, capsys):
+    data_dir = tmp_path / "_data"
+    data_dir.mkdir()
+    keys = ["bajrang-baan", "hanuman-chalisa", "sundar-kaand"]
+    (data_dir / "collections.yml").write_text(yaml.dump({
+        key: {"name_en": key.title(), "permalink_base": f"/{key}/", "enabled": True}
+        for key in keys
+    }))
+    for key in keys:
+        _make_verses(tmp_path / "_verses" / key, "chaupai-01", "chaupai-02")
+
+    assert scaffold_many(keys + ["missing"], tmp_path) == [True, True, True, False]
+    for key in keys:
+        assert (tmp_path / key / "index.html").exists()
+        assert (tmp_path / key / "full-text.html").exists()
+
+    # Messages come out grouped per collection, in key order
+    captured = capsys.readouterr()
+    written = [
+        Path(line.split("Wrote ", 1)[1].split(" (")[0]).parent.name
+        for line in captured.out.splitlines() if "✓ Wrote" in line
+    ]
+    assert written == [key for key in keys for _ in range(2)]
+    assert "'missing' not found" in captured.err
+
+
+def test_scaffold_uses_passed_collections_without_reading_yml(tmp_path):
+    _make_verses(tmp_path / "_verses" / "bajrang-baan", "chaupai-01")
+    collections = {"bajrang-baan": {"name_en": "Bajrang Baan", "permalink_base": "/bajrang-baan/"}}
+    assert scaffold_collection("bajrang-baan", tmp_path, collections=collections)
+    assert (tmp_path / "bajrang-baan" / "index.html").exists()
+    assert not scaffold_collection("missing", tmp_path, collections=collections)
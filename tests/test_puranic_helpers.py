@@ -1,19 +1,34 @@
 """Tests for pure helper functions in verse_sdk/cli/puranic_context.py."""
 
+import json
+import sys
+import threading
+import types
 from pathlib import Path
 
 import pytest
 import yaml
 
+from verse_sdk.cli import puranic_context
 from verse_sdk.cli.puranic_context import (
     _VAGUE_SECTIONS,
+    EpisodeCorpus,
+    _has_puranic_context,
+    _process_verse_buffered,
     _reject_uncited_entries,
+    _VerseOutput,
     build_prompt,
     cosine_similarity,
+    cosine_similarity_batch,
     filter_episodes_by_subject,
+    generate_puranic_context,
     load_collection_subject,
     load_project_defaults,
+    load_rag_index,
     parse_verse_file,
+    patch_frontmatter,
+    retrieve_topk_gpu,
+    search_episodes,
     update_verse_file,
 )
 
@@ -128,6 +143,17 @@ def test_load_project_defaults_empty_file(tmp_path):
     assert result == {}
 
 
+def test_load_project_defaults_sees_edits_and_returns_copies(tmp_path):
+    data_dir = tmp_path / "_data"
+    data_dir.mkdir()
+    config = data_dir / "verse-config.yml"
+    config.write_text("defaults:\n  subject: Hanuman\n")
+    load_project_defaults(tmp_path)["subject"] = "mutated"
+    assert load_project_defaults(tmp_path) == {"subject": "Hanuman"}
+    config.write_text("defaults:\n  subject: Shiva, Parvati\n")
+    assert load_project_defaults(tmp_path) == {"subject": "Shiva, Parvati"}
+
+
 # ---------------------------------------------------------------------------
 # load_collection_subject
 # ---------------------------------------------------------------------------
@@ -222,6 +248,142 @@ def test_cosine_similarity_opposite_vectors():
     assert cosine_similarity([1.0, 0.0], [-1.0, 0.0]) == pytest.approx(-1.0, abs=1e-6)
 
 
+def test_cosine_similarity_ignores_magnitude():
+    assert cosine_similarity([3.0, 4.0], [6.0, 8.0]) == pytest.approx(1.0, abs=1e-6)
+
+
+def test_cosine_similarity_zero_vector():
+    assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+
+def test_cosine_similarity_batch_matches_scalar():
+    query = [0.6, 0.8]
+    rows = [[1.0, 0.0], [0.0, 2.0], [-3.0, -4.0], [0.0, 0.0]]
+    scores = cosine_similarity_batch(query, rows)
+    expected = [cosine_similarity(query, r) for r in rows]
+    assert scores.tolist() == pytest.approx(expected, abs=1e-6)
+
+
+def test_search_episodes_ranks_by_similarity():
+    episodes = [{"id": "a"}, {"id": "b"}, {"id": "c"}, {"id": "no-embedding"}]
+    embeddings = [
+        {"id": "a", "embedding": [0.0, 1.0]},
+        {"id": "b", "embedding": [1.0, 0.0]},
+        {"id": "c", "embedding": [0.7, 0.7]},
+    ]
+    result = search_episodes([1.0, 0.0], episodes, embeddings, top_k=2)
+    assert [ep["id"] for ep in result] == ["b", "c"]
+
+
+def _corpus(*vectors):
+    episodes = [{"id": str(i)} for i in range(len(vectors))]
+    embeddings = [{"id": str(i), "embedding": v} for i, v in enumerate(vectors)]
+    return EpisodeCorpus(episodes, embeddings)
+
+
+def test_retrieve_topk_orders_best_first():
+    corpus = _corpus([0.0, 1.0], [1.0, 0.0], [0.7, 0.7], [-1.0, 0.0])
+    assert retrieve_topk_gpu([1.0, 0.0], corpus, 3) == [1, 2, 0]
+    assert retrieve_topk_gpu([1.0, 0.0], corpus, 10)[-1] == 3
+    assert retrieve_topk_gpu([1.0, 0.0], _corpus(), 3) == []
+    assert search_episodes([1.0, 0.0], [], [], corpus=corpus)[0] == {"id": "1"}
+
+
+def test_episode_corpus_uploads_to_device_once(monkeypatch):
+    uploads = []
+
+    class FakeTensor:
+        def __init__(self, array):
+            self.array = array
+            self.device = "cuda"
+
+        def cuda(self):
+            uploads.append(self.array.shape)
+            return self
+
+        def to(self, device):
+            return self
+
+        def __matmul__(self, other):
+            return self.array @ other.array
+
+    def topk(scores, k):
+        indices = scores.argsort()[::-1][:k]
+        return types.SimpleNamespace(indices=types.SimpleNamespace(cpu=lambda: indices))
+
+    fake_torch = types.SimpleNamespace(from_numpy=FakeTensor, topk=topk)
+    monkeypatch.setattr(puranic_context, "_cuda_torch", lambda: fake_torch)
+    monkeypatch.setattr(puranic_context, "_GPU_MIN_CANDIDATES", 1)
+
+    corpus = _corpus([0.0, 1.0], [1.0, 0.0])
+    assert retrieve_topk_gpu([1.0, 0.1], corpus, 1) == [1]
+    assert retrieve_topk_gpu([0.1, 1.0], corpus, 1) == [0]
+    assert uploads == [(2, 2)]
+
+
+def test_load_rag_index_reads_each_source_once(monkeypatch):
+    calls = []
+
+    def episodes(key, project_dir):
+        calls.append(key)
+        return [{"id": f"{key}-1"}]
+
+    monkeypatch.setattr(puranic_context, "load_index_meta", lambda key, d: {"embedding_provider": "bedrock-cohere"})
+    monkeypatch.setattr(puranic_context, "load_episode_index", episodes)
+    monkeypatch.setattr(
+        puranic_context, "load_episode_embeddings",
+        lambda key, d, embeddings_dir_override=None: [{"id": f"{key}-1", "embedding": [1.0, 0.0]}],
+    )
+
+    rag = load_rag_index({"a": {}, "b": {}}, Path("."))
+    assert rag.provider == "bedrock-cohere"
+    assert [ep["id"] for ep in rag.corpus.search([1.0, 0.0])] == ["a-1", "b-1"]
+    assert calls == ["a", "b"]
+
+
+def test_load_rag_index_without_embeddings_has_no_corpus(monkeypatch):
+    monkeypatch.setattr(puranic_context, "load_index_meta", lambda key, d: None)
+    monkeypatch.setattr(puranic_context, "load_embeddings_model", lambda key, d, embeddings_dir_override=None: None)
+    monkeypatch.setattr(puranic_context, "load_episode_index", lambda key, d: [{"id": "a-1"}])
+    monkeypatch.setattr(puranic_context, "load_episode_embeddings", lambda key, d, embeddings_dir_override=None: [])
+
+    rag = load_rag_index({"a": {}}, Path("."))
+    assert rag.provider == "openai"
+    assert rag.corpus is None
+
+
+def test_process_verse_buffered_keeps_each_verses_output_together(monkeypatch, capsys):
+    both_started = threading.Barrier(2)
+
+    def fake_process_verse(verse_file, **kwargs):
+        print(f"{verse_file} start")
+        both_started.wait(timeout=5)
+        print(f"{verse_file} warning", file=sys.stderr)
+        print(f"{verse_file} end")
+        return "added"
+
+    monkeypatch.setattr(puranic_context, "process_verse", fake_process_verse)
+    monkeypatch.setattr(sys, "stdout", _VerseOutput(sys.stdout))
+    monkeypatch.setattr(sys, "stderr", _VerseOutput(sys.stderr))
+
+    results = {}
+    threads = [
+        threading.Thread(target=lambda v=v: results.setdefault(v, _process_verse_buffered(v)))
+        for v in ("v1", "v2")
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print("main thread")
+    assert capsys.readouterr().out == "main thread\n"
+
+    result, chunks, exc = results["v1"]
+    assert (result, exc) == ("added", None)
+    assert "".join(text for _, text in chunks) == "v1 start\nv1 warning\nv1 end\n"
+
+
 # ---------------------------------------------------------------------------
 # parse_verse_file / update_verse_file
 # ---------------------------------------------------------------------------
@@ -235,6 +397,32 @@ def test_parse_verse_file_valid(tmp_path):
     assert "Body text here" in body
 
 
+def test_parse_verse_file_without_body(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text("---\nverse_number: 1\n---\n" + "Body text\n" * 2000)
+    assert parse_verse_file(f, with_body=False) == ({"verse_number": 1}, None)
+    f.write_text("No frontmatter")
+    assert parse_verse_file(f, with_body=False) == ({}, None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("---\ntitle_en: V\npuranic_context:\n- id: a\n---\nBody", True),
+    ("---\npuranic_context:\n  - id: a\n---\n", True),
+    ("---\npuranic_context: []\n---\n", False),
+    ("---\ntitle_en: V\n---\npuranic_context:\n- id: in body\n", False),
+    ("puranic_context:\n- id: a\n", False),
+    ("", False),
+])
+def test_has_puranic_context(tmp_path, text, expected):
+    f = tmp_path / "verse-01.md"
+    f.write_text(text)
+    assert _has_puranic_context(f) is expected
+
+
+def test_has_puranic_context_missing_file(tmp_path):
+    assert _has_puranic_context(tmp_path / "missing.md") is False
+
+
 def test_parse_verse_file_missing_returns_none(tmp_path):
     fm, body = parse_verse_file(tmp_path / "nonexistent.md")
     assert fm is None
@@ -259,6 +447,65 @@ def test_update_verse_file_roundtrip(tmp_path):
     assert "Original body" in body2
 
 
+def test_patch_frontmatter_appends_and_keeps_other_lines(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text("---\ntitle_hi: 'जय हनुमान'\nverse_number: 1\n---\nOriginal body", encoding="utf-8")
+    assert patch_frontmatter(f, {"puranic_context": [{"id": "a", "title": "ज्ञान"}]})
+    text = f.read_text(encoding="utf-8")
+    assert text.startswith("---\ntitle_hi: 'जय हनुमान'\nverse_number: 1\n")
+    fm, body = parse_verse_file(f)
+    assert fm["puranic_context"] == [{"id": "a", "title": "ज्ञान"}]
+    assert body == "\nOriginal body"
+
+
+def test_patch_frontmatter_replaces_existing_block(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text(
+        "---\nverse_number: 1\npuranic_context:\n- id: old\n  title: Old\n"
+        "title_en: Verse 1\n---\nBody"
+    )
+    assert patch_frontmatter(f, {"puranic_context": [{"id": "new"}]})
+    fm, body = parse_verse_file(f)
+    assert fm == {"verse_number": 1, "puranic_context": [{"id": "new"}], "title_en": "Verse 1"}
+    assert body == "\nBody"
+
+
+def test_patch_frontmatter_keeps_comment_and_blank_line_after_block(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text(
+        "---\npuranic_context:\n- id: old\n\n# Translations below\ntitle_en: X\n---\nBody"
+    )
+    assert patch_frontmatter(f, {"puranic_context": [{"id": "new"}]})
+    assert f.read_text() == (
+        "---\npuranic_context:\n- id: new\n\n# Translations below\ntitle_en: X\n---\nBody"
+    )
+
+
+def test_patch_frontmatter_replaces_block_with_inner_blank_line(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text("---\npuranic_context:\n- id: a\n\n- id: b\ntitle_en: X\n---\nBody")
+    assert patch_frontmatter(f, {"puranic_context": [{"id": "new"}]})
+    assert f.read_text() == "---\npuranic_context:\n- id: new\ntitle_en: X\n---\nBody"
+
+
+def test_patch_frontmatter_with_parsed_frontmatter(tmp_path):
+    f = tmp_path / "verse-01.md"
+    f.write_text("---\nverse_number: 1\n---\nBody")
+    fm, _ = parse_verse_file(f)
+    fm["puranic_context"] = [{"id": "a"}]
+    assert patch_frontmatter(f, {"puranic_context": fm["puranic_context"]}, fm)
+    assert parse_verse_file(f)[0] == fm
+    # A stale parsed mapping no longer matches the file, so the splice is refused
+    assert patch_frontmatter(f, {"title_en": "Verse 1"}, {"title_en": "Verse 1"}) is False
+
+
+def test_patch_frontmatter_refuses_files_without_frontmatter(tmp_path):
+    f = tmp_path / "verse.md"
+    f.write_text("Just body text")
+    assert patch_frontmatter(f, {"a": 1}) is False
+    assert f.read_text() == "Just body text"
+
+
 # ---------------------------------------------------------------------------
 # build_prompt
 # ---------------------------------------------------------------------------
@@ -279,3 +526,86 @@ def test_build_prompt_includes_translation():
     fm = {"translation": {"en": "Victory to Hanuman"}}
     prompt = build_prompt(fm, "v1")
     assert "Victory to Hanuman" in prompt
+
+
+# ---------------------------------------------------------------------------
+# generate_puranic_context response cache
+# ---------------------------------------------------------------------------
+
+def _fake_client(calls, raw):
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = types.SimpleNamespace(content=raw)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+
+
+def test_generate_puranic_context_reuses_cached_response(tmp_path, monkeypatch):
+    calls = []
+    raw = json.dumps({"entries": [{
+        "id": "churning", "type": "story", "priority": "high",
+        "source_texts": [{"text": "Bhagavata Purana", "section": "Canto 8, Chapter 7"}],
+    }]})
+    monkeypatch.setattr(puranic_context, "_get_openai_client", lambda: _fake_client(calls, raw))
+    fm = {"devanagari": "जय हनुमान", "title_en": "Verse 1"}
+
+    first = generate_puranic_context(fm, "verse-01", cache_dir=tmp_path)
+    assert generate_puranic_context(fm, "verse-01", cache_dir=tmp_path) == first
+    assert len(calls) == 1
+    assert calls[0]["response_format"] == {"type": "json_object"}
+    assert first and first[0]["id"] == "churning"
+
+    # A different prompt misses the cache, and no cache_dir always calls the API
+    generate_puranic_context({**fm, "title_en": "Verse 2"}, "verse-02", cache_dir=tmp_path)
+    generate_puranic_context(fm, "verse-01")
+    assert len(calls) == 3
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_generate_puranic_context_refresh_skips_cached_response(tmp_path, monkeypatch):
+    calls = []
+    raw = json.dumps({"entries": []})
+    monkeypatch.setattr(puranic_context, "_get_openai_client", lambda: _fake_client(calls, raw))
+    fm = {"title_en": "Verse 1"}
+
+    generate_puranic_context(fm, "verse-01", cache_dir=tmp_path)
+    generate_puranic_context(fm, "verse-01", cache_dir=tmp_path, refresh_cache=True)
+    assert len(calls) == 2
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+@pytest.mark.parametrize("value, enabled", [(None, False), ("", False), ("0", False), ("1", True), ("yes", True)])
+def test_response_cache_is_opt_in(monkeypatch, value, enabled):
+    if value is None:
+        monkeypatch.delenv("PURANIC_RESPONSE_CACHE", raising=False)
+    else:
+        monkeypatch.setenv("PURANIC_RESPONSE_CACHE", value)
+    assert puranic_context._response_cache_enabled() is enabled
+
+
+def test_generate_puranic_context_does_not_cache_errors(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(puranic_context, "_get_openai_client", lambda: _fake_client(calls, '{"entries": ['))
+    assert generate_puranic_context({"title_en": "V"}, "v1", cache_dir=tmp_path) is None
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ('{"entries": []}', []),
+    ('{"context": []}', None),
+    ('[]', None),
+])
+def test_generate_puranic_context_reads_entries_object(monkeypatch, raw, expected):
+    monkeypatch.setattr(puranic_context, "_get_openai_client", lambda: _fake_client([], raw))
+    assert generate_puranic_context({"title_en": "V"}, "v1") == expected
+
+
+def test_main_rejects_non_integer_workers_env(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PURANIC_WORKERS", "many")
+    monkeypatch.setattr(sys, "argv", ["verse-puranic-context", "--collection", "c", "--verse", "v"])
+    with pytest.raises(SystemExit) as exc:
+        puranic_context.main()
+    assert exc.value.code == 2
+    assert "invalid int value: 'many'" in capsys.readouterr().err
@@ -0,0 +1,210 @@
+"""Tests for verse_sdk/cli/status.py — collection status checks."""
+
+import io
+import json
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import pytest
+
+from verse_sdk.cli import status as status_module
+from verse_sdk.cli.status import (
+    analyze_collection,
+    check_embeddings_status,
+    check_verse_status,
+    get_file_info,
+    parse_verse_frontmatter,
+    print_json,
+    scan_collection_dirs,
+)
+
+
+def _project(tmp_path):
+    verses = tmp_path / "_verses" / "hanuman-chalisa"
+    verses.mkdir(parents=True)
+    (verses / "chaupai-01.md").write_text(
+        "---\ndevanagari: जय\ntranslation:\n  en: Victory\n---\nBody\n", encoding="utf-8"
+    )
+    (verses / "chaupai-02.md").write_text("---\ndevanagari: जय\n---\n", encoding="utf-8")
+    (verses / "notes.txt").write_text("not a verse")
+    (verses / "drafts.md").mkdir()
+
+    audio = tmp_path / "audio" / "hanuman-chalisa"
+    audio.mkdir(parents=True)
+    (audio / "chaupai-01-full.mp3").write_bytes(b"a" * 10)
+    (audio / "chaupai-01-slow.mp3").write_bytes(b"a" * 20)
+
+    images = tmp_path / "images" / "hanuman-chalisa"
+    (images / "traditional").mkdir(parents=True)
+    (images / "traditional" / "chaupai-01.png").write_bytes(b"p")
+    (images / "chaupai-02.png").write_bytes(b"p")
+    return tmp_path
+
+
+def test_check_verse_status_uses_scanned_entries(tmp_path):
+    project = _project(tmp_path)
+    verse_file = project / "_verses" / "hanuman-chalisa" / "chaupai-01.md"
+    status = check_verse_status(
+        "hanuman-chalisa", verse_file, project,
+        dir_entries=scan_collection_dirs("hanuman-chalisa", project),
+    )
+
+    full = project / "audio" / "hanuman-chalisa" / "chaupai-01-full.mp3"
+    assert status["audio"]["full"] == get_file_info(full)
+    assert status["audio"]["slow"]["size"] == 20
+    assert status["verse_file"] == get_file_info(verse_file)
+    assert list(status["images"]) == ["traditional"]
+    assert status["has_translation"] is True
+
+
+def test_check_verse_status_scans_when_not_given_entries(tmp_path):
+    project = _project(tmp_path)
+    verse_file = project / "_verses" / "hanuman-chalisa" / "chaupai-02.md"
+    status = check_verse_status("hanuman-chalisa", verse_file, project)
+    assert status["audio"] == {"full": None, "slow": None}
+    assert list(status["images"]) == ["default"]
+
+
+def test_analyze_collection_lists_only_markdown(tmp_path):
+    analysis = analyze_collection("hanuman-chalisa", _project(tmp_path))
+    assert [v["verse_id"] for v in analysis["verses"]] == ["chaupai-01", "chaupai-02"]
+    assert analysis["statistics"]["verses_complete"] == 1
+    assert analysis["statistics"]["verses_with_images"] == 2
+
+
+def test_scan_collection_dirs_missing_dirs_are_empty(tmp_path):
+    scanned = scan_collection_dirs("missing", tmp_path)
+    assert all(entries == {} for entries in scanned.values())
+
+
+def test_analyze_collection_threaded_matches_serial(tmp_path):
+    project = _project(tmp_path)
+    serial = analyze_collection("hanuman-chalisa", project, workers=1)
+    assert analyze_collection("hanuman-chalisa", project, workers=8) == serial
+
+
+def test_parse_verse_frontmatter(tmp_path):
+    f = tmp_path / "verse.md"
+    f.write_text("---\ndevanagari: जय\n---\n" + "body ---\n" * 3000, encoding="utf-8")
+    assert parse_verse_frontmatter(f) == {"devanagari": "जय"}
+    f.write_text("no frontmatter")
+    assert parse_verse_frontmatter(f) == {}
+    assert parse_verse_frontmatter(tmp_path / "missing.md") == {}
+
+
+def test_check_embeddings_status_legacy_list(tmp_path):
+    (tmp_path / "data").mkdir()
+    items = [{"collection": "a"}, {"collection": "b"}, {"collection": "a"}, {}]
+    (tmp_path / "data" / "embeddings.json").write_text(json.dumps(items))
+    status = check_embeddings_status(tmp_path)
+    assert status["verse_count"] == 4
+    assert status["collections"] == {"a": 2, "b": 1, "unknown": 1}
+
+
+def test_check_embeddings_status_manifest(tmp_path):
+    manifest = tmp_path / "data" / "embeddings" / "collections" / "index.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text(json.dumps({"collections": [
+        {"collection": "a", "counts": {"total": 5}},
+        {"collection": "b", "counts": {"en": 3}},
+    ]}))
+    status = check_embeddings_status(tmp_path)
+    assert (status["source"], status["verse_count"]) == ("manifest", 8)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_print_json_matches_stdlib_output(capsys, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(status_module, "orjson", None)
+    elif status_module.orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"modified": datetime(2024, 1, 2, 3, 4, 5), "text": "जय", "counts": {"a": 1}, 1: [2.5, None]}
+    print_json(data)
+    out = capsys.readouterr().out
+    assert json.loads(out) == json.loads(json.dumps(data, indent=2, default=str))
+    assert out.startswith('{\n  "modified": "2024-01-02 03:04:05"')
+
+
+def test_main_text_report_written_once(tmp_path, monkeypatch):
+    project = _project(tmp_path)
+    writes = []
+
+    class _Stdout:
+        def write(self, text):
+            writes.append(text)
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(status_module.sys, "stdout", _Stdout())
+    monkeypatch.setattr(
+        status_module.sys, "argv",
+        ["verse-status", "--collection", "hanuman-chalisa", "--detailed", "--project-dir", str(project)],
+    )
+    status_module.main()
+
+    assert len(writes) == 1
+    assert "VERSE COLLECTION STATUS" in writes[0]
+    assert "chaupai-02" in writes[0]
+
+
+def test_print_collection_status_detailed_lines(tmp_path, capsys):
+    analysis = analyze_collection("hanuman-chalisa", _project(tmp_path))
+    status_module.print_collection_status(analysis, detailed=True)
+    out = capsys.readouterr().out
+    details = out.split("Verse Details:\n", 1)[1].splitlines()
+    assert details[0].startswith("   ├─ chaupai-01")
+    assert details[1].startswith("   ├─ chaupai-02")
+    assert details[2] == "   │  └─ Missing: audio_full, audio_slow"
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, "0.0 B"),
+    (1023, "1023.0 B"),
+    (1024, "1.0 KB"),
+    (1536, "1.5 KB"),
+    (1024 ** 2 - 1, "1024.0 KB"),
+    (5 * 1024 ** 3, "5.0 GB"),
+    (2048 * 1024 ** 4, "2048.0 TB"),
+])
+def test_format_size(size, expected):
+    assert status_module.format_size(size) == expected
+
+
+def test_check_verse_status_missing_verse_file(tmp_path):
+    project = _project(tmp_path)
+    verse_file = project / "_verses" / "hanuman-chalisa" / "chaupai-09.md"
+    status = check_verse_status("hanuman-chalisa", verse_file, project)
+    assert status["verse_file"] is None
+    assert status["frontmatter"] == {}
+
+
+def test_broken_symlink_is_reported_missing(tmp_path):
+    project = _project(tmp_path)
+    audio = project / "audio" / "hanuman-chalisa"
+    (audio / "chaupai-02-full.mp3").symlink_to(audio / "gone.mp3")
+    verse_file = project / "_verses" / "hanuman-chalisa" / "chaupai-02.md"
+
+    scanned = check_verse_status(
+        "hanuman-chalisa", verse_file, project,
+        dir_entries=scan_collection_dirs("hanuman-chalisa", project),
+    )
+    unscanned = check_verse_status("hanuman-chalisa", verse_file, project)
+    assert scanned["audio"]["full"] is None
+    assert unscanned["audio"]["full"] is None
+
+
+def test_check_verse_status_without_entries_does_not_scan(tmp_path, monkeypatch):
+    project = _project(tmp_path)
+    monkeypatch.setattr(status_module, "_scan_dir", pytest.fail)
+    verse_file = project / "_verses" / "hanuman-chalisa" / "chaupai-01.md"
+    status = check_verse_status("hanuman-chalisa", verse_file, project)
+    assert status["audio"]["slow"]["size"] == 20
+    assert analyze_collection("hanuman-chalisa", project, specific_verse="chaupai-01")["verse_count"] == 1
+
+
+def test_print_json_to_text_only_stdout():
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print_json({"text": "जय", "count": 1})
+    assert json.loads(buf.getvalue()) == {"text": "जय", "count": 1}
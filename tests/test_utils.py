@@ -1,19 +1,28 @@
 """Tests for verse_sdk/utils/ — yaml_parser and file_utils."""
 
+import io
 import json
 from pathlib import Path
 
 import pytest
+import yaml
 
 from verse_sdk.cli.generate import extract_verse_number_from_id
 from verse_sdk.utils.file_utils import (
     ensure_directory,
     find_markdown_files,
     get_file_size_kb,
+    load_all_frontmatter,
     read_json,
     write_json,
 )
-from verse_sdk.utils.yaml_parser import extract_yaml_frontmatter, get_nested_value
+from verse_sdk.utils.yaml_parser import (
+    dump_yaml,
+    extract_yaml_frontmatter,
+    get_nested_value,
+    load_yaml,
+    load_yaml_file,
+)
 
 # ---------------------------------------------------------------------------
 # extract_yaml_frontmatter
@@ -26,6 +35,22 @@ def test_extract_frontmatter_basic(tmp_path):
     assert result == {"verse_number": 1, "title_en": "Test"}
 
 
+def test_extract_frontmatter_sees_rewrites(tmp_path):
+    f = tmp_path / "verse.md"
+    f.write_text("---\nverse_number: 1\n---\n")
+    assert extract_yaml_frontmatter(f) == {"verse_number": 1}
+    f.write_text("---\nverse_number: 22\n---\n")
+    assert extract_yaml_frontmatter(f) == {"verse_number": 22}
+
+
+def test_extract_frontmatter_returns_independent_copies(tmp_path):
+    f = tmp_path / "verse.md"
+    f.write_text("---\ntags: [a]\n---\n")
+    first = extract_yaml_frontmatter(f)
+    first["tags"].append("b")
+    assert extract_yaml_frontmatter(f) == {"tags": ["a"]}
+
+
 def test_extract_frontmatter_no_delimiter(tmp_path):
     f = tmp_path / "verse.md"
     f.write_text("No frontmatter here")
@@ -52,6 +77,54 @@ def test_extract_frontmatter_nested(tmp_path):
     assert result["title"] == {"en": "Hello", "hi": "नमस्ते"}
 
 
+# ---------------------------------------------------------------------------
+# load_yaml
+# ---------------------------------------------------------------------------
+
+def test_load_yaml_matches_safe_load():
+    text = "title:\n  en: Hello\n  hi: नमस्ते\nverses: [1, 2]\n"
+    assert load_yaml(text) == {"title": {"en": "Hello", "hi": "नमस्ते"}, "verses": [1, 2]}
+
+
+def test_load_yaml_empty_returns_none():
+    assert load_yaml("") is None
+
+
+def test_load_yaml_rejects_python_tags():
+    with pytest.raises(Exception):
+        load_yaml("!!python/object/apply:os.system ['true']")
+
+
+def test_dump_yaml_matches_yaml_dump():
+    data = {"devanagari": "जय हनुमान ज्ञान गुन सागर", "verse_number": 1, "tags": ["a", "b"], "note": "🙏"}
+    opts = dict(allow_unicode=True, sort_keys=False, default_flow_style=False)
+    assert dump_yaml(data, **opts) == yaml.dump(data, **opts)
+    assert "🙏" in dump_yaml(data, **opts)
+    assert load_yaml(dump_yaml(data, **opts)) == data
+
+
+def test_dump_yaml_writes_to_stream():
+    data = {"note": "जय 🙏"}
+    stream = io.StringIO()
+    assert dump_yaml(data, stream, allow_unicode=True) is None
+    assert stream.getvalue() == yaml.safe_dump(data, allow_unicode=True)
+
+
+def test_load_yaml_file_sees_rewrites_and_returns_copies(tmp_path):
+    f = tmp_path / "collections.yml"
+    f.write_text("hanuman-chalisa:\n  enabled: true\n")
+    first = load_yaml_file(f)
+    first["hanuman-chalisa"]["enabled"] = False
+    assert load_yaml_file(f) == {"hanuman-chalisa": {"enabled": True}}
+    f.write_text("sundar-kaand:\n  enabled: false\n")
+    assert load_yaml_file(f) == {"sundar-kaand": {"enabled": False}}
+
+
+def test_load_yaml_file_missing_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_yaml_file(tmp_path / "missing.yml")
+
+
 # ---------------------------------------------------------------------------
 # get_nested_value
 # ---------------------------------------------------------------------------
@@ -148,6 +221,16 @@ def test_find_markdown_files(tmp_path):
     assert "notes.txt" not in names
 
 
+def test_load_all_frontmatter_keeps_file_order(tmp_path):
+    for n in range(1, 6):
+        (tmp_path / f"verse-{n:02d}.md").write_text(f"---\nverse_number: {n}\n---\n")
+    (tmp_path / "notes.md").write_text("no front matter")
+    entries = load_all_frontmatter(tmp_path, "verse-*.md", workers=3)
+    assert [f.name for f, _ in entries] == [f"verse-{n:02d}.md" for n in range(1, 6)]
+    assert [data["verse_number"] for _, data in entries] == [1, 2, 3, 4, 5]
+    assert dict(load_all_frontmatter(tmp_path))[tmp_path / "notes.md"] is None
+
+
 def test_get_file_size_kb(tmp_path):
     f = tmp_path / "test.txt"
     f.write_bytes(b"x" * 1024)
@@ -6,10 +6,11 @@ A Python SDK for generating rich multimedia content for verse-based texts.
 
 __version__ = "0.26.1"
 
+import importlib
+
 # Note: Import only what exists to avoid circular imports
 # from .embeddings import EmbeddingGenerator
 # from .audio import AudioGenerator
-from .utils import file_utils, yaml_parser
 
 __all__ = [
     # "EmbeddingGenerator",
@@ -17,3 +18,12 @@ __all__ = [
     "yaml_parser",
     "file_utils",
 ]
+
+
+def __getattr__(name):
+    # yaml_parser and file_utils are loaded lazily (PEP 562)
+    if name in __all__:
+        module = importlib.import_module(f".utils.{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -37,6 +37,7 @@ Requirements:
 """
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -78,6 +79,7 @@ VERBOSE_MODE = False
 QUIET_MODE = False
 _SCENE_SEQUENCE_WARNED_FILES = set()
 COLLECTION_OVERVIEW_VERSE_IDS = ("cover",)
+_VERSE_NUM_RE = re.compile(r'[-_](\d+)$')
 
 
 def _is_verbose() -> bool:
@@ -1320,6 +1322,7 @@ def get_verse_sequence(collection: str, project_dir: Path = Path.cwd()) -> tuple
         return None, None
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_verse_number_from_id(verse_id: str) -> Optional[int]:
     """
     Extract the number from a verse ID.
@@ -1330,10 +1333,8 @@ def extract_verse_number_from_id(verse_id: str) -> Optional[int]:
     Returns:
         The number from the ID, or None if not found
     """
-    match = re.search(r'[-_](\d+)$', verse_id)
-    if match:
-        return int(match.group(1))
-    return None
+    match = _VERSE_NUM_RE.search(verse_id)
+    return int(match.group(1)) if match else None
 
 
 def get_collection_permalink(collection: str, project_dir: Path = Path.cwd()) -> str:
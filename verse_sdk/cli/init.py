@@ -92,6 +92,12 @@ __pycache__/
 *.so
 .Python
 
+# Parsed config caches
+_data/.*.json
+
+# Cached AI responses
+.cache/
+
 # IDEs
 .vscode/
 .idea/
@@ -24,11 +24,17 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
+import itertools
+import operator
+import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import yaml
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 # ---------------------------------------------------------------------------
 # Section label + icon registry
@@ -54,6 +60,17 @@ _SUFFIX_QUALIFIERS: Dict[str, Dict] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _qualifier_labels(qualifier: str) -> Tuple[str, str]:
+    """Return (en, hi) for a suffix qualifier, title-casing unknown ones."""
+    qual = _SUFFIX_QUALIFIERS.get(qualifier)
+    if qual:
+        return qual["en"], qual["hi"]
+    title = qualifier.replace("-", " ").title()
+    return title, title
+
+
+@functools.lru_cache(maxsize=256)
 def _section_label(prefix: str, qualifier: Optional[str] = None) -> Tuple[str, str, str]:
     """Return (icon, en_label, hi_label) for a section type."""
     info = _SECTION_LABELS.get(prefix, {
@@ -65,12 +82,9 @@ def _section_label(prefix: str, qualifier: Optional[str] = None) -> Tuple[str, s
     en = info["en"]
     hi = info["hi"]
     if qualifier:
-        qual = _SUFFIX_QUALIFIERS.get(qualifier, {
-            "en": qualifier.replace("-", " ").title(),
-            "hi": qualifier.replace("-", " ").title(),
-        })
-        en = f"{qual['en']} {en}"
-        hi = f"{qual['hi']} {hi}"
+        qual_en, qual_hi = _qualifier_labels(qualifier)
+        en = f"{qual_en} {en}"
+        hi = f"{qual_hi} {hi}"
     return icon, en, hi
 
 
@@ -78,12 +92,34 @@ def _section_label(prefix: str, qualifier: Optional[str] = None) -> Tuple[str, s
 # Section detection
 # ---------------------------------------------------------------------------
 
-def detect_sections(verses_dir: Path, sequence: Optional[List[str]] = None) -> List[Dict]:
+# "chaupai-01" → prefix "chaupai", tail "01"; splits on the last hyphen
+_STEM_RE = re.compile(r"^(?P<prefix>.*)-(?P<tail>[^-]*)$", re.DOTALL)
+
+
+def _split_stem(vid: str) -> Tuple[str, Optional[str]]:
+    """Return (prefix, tail) for a verse stem; tail is None when there is no hyphen."""
+    m = _STEM_RE.match(vid)
+    if m is None:
+        return vid, None
+    return m["prefix"], m["tail"]
+
+
+def _verse_stems(verses_dir: str) -> frozenset:
+    """Stems of *.md entries in verses_dir."""
+    with os.scandir(verses_dir) as entries:
+        return frozenset(
+            os.path.splitext(e.name)[0] for e in entries if e.name.endswith(".md")
+        )
+
+
+def detect_sections(verses_dir: Union[str, Path], sequence: Optional[List[str]] = None) -> List[Dict]:
     """
     Scan verse files and group consecutive same-prefix runs.
 
     Returns a list of dicts:
-        { prefix, verse_ids, is_loop, qualifier }
+        { prefix, verse_ids, suffixes, is_loop, qualifier }
+
+    suffixes      → the part after the last hyphen of each verse id (None if none)
 
     is_loop=True  → all verses are numbered (01, 02 ...) and there are >3 of them
     qualifier     → named suffix for single-verse sections (opening, closing, etc.)
@@ -93,43 +129,42 @@ def detect_sections(verses_dir: Path, sequence: Optional[List[str]] = None) -> L
     alphabetically — this preserves natural order (e.g. doha-opening, chaupai-01..N,
     doha-closing) rather than collapsing them alphabetically.
     """
-    if not verses_dir.exists():
+    # Like Path.glob, treat a missing, non-directory or unreadable path as empty
+    try:
+        all_stems = _verse_stems(os.fspath(verses_dir))
+    except OSError:
         return []
 
-    all_stems = {f.stem for f in verses_dir.glob("*.md")}
-
     if sequence:
         # Use sequence order; append any files not in sequence at the end
-        ordered = [vid for vid in sequence if vid in all_stems]
-        ordered += sorted(all_stems - set(ordered))
-        verse_ids = ordered
+        seq_set = set(sequence)
+        verse_ids = [vid for vid in sequence if vid in all_stems]
+        verse_ids += sorted(s for s in all_stems if s not in seq_set)
     else:
         verse_ids = sorted(all_stems)
 
-    def _prefix(vid: str) -> str:
-        parts = vid.rsplit("-", 1)
-        return parts[0] if len(parts) == 2 else vid
-
-    # Group consecutive same-prefix runs
+    # Split each id once, then group consecutive same-prefix runs
+    split_ids = [(vid, *_split_stem(vid)) for vid in verse_ids]
     sections: List[Dict] = []
-    for vid in verse_ids:
-        p = _prefix(vid)
-        if sections and sections[-1]["prefix"] == p:
-            sections[-1]["verse_ids"].append(vid)
-        else:
-            sections.append({"prefix": p, "verse_ids": [vid]})
-
-    for section in sections:
-        vids = section["verse_ids"]
-        all_numbered = all(vid.rsplit("-", 1)[-1].isdigit() for vid in vids)
-        section["is_loop"] = all_numbered and len(vids) > 3
+    for prefix, group in itertools.groupby(split_ids, key=operator.itemgetter(1)):
+        vids, _, suffixes = (list(column) for column in zip(*group))
+        all_numbered = all(
+            (vid if suffix is None else suffix).isdigit() for vid, suffix in zip(vids, suffixes)
+        )
 
         # Qualifier for single named verses (doha-opening → qualifier "opening")
+        qualifier = None
         if len(vids) == 1:
-            suffix = vids[0].rsplit("-", 1)[-1] if "-" in vids[0] else ""
-            section["qualifier"] = suffix if not suffix.isdigit() else None
-        else:
-            section["qualifier"] = None
+            suffix = suffixes[0] or ""
+            qualifier = suffix if not suffix.isdigit() else None
+
+        sections.append({
+            "prefix": prefix,
+            "verse_ids": vids,
+            "suffixes": suffixes,
+            "is_loop": all_numbered and len(vids) > 3,
+            "qualifier": qualifier,
+        })
 
     return sections
 
@@ -160,49 +195,57 @@ def _loop_section(prefix: str, collection_key: str, icon: str, en: str, hi: str)
     )
 
 
-def _individual_section(verse_ids: List[str], collection_key: str, icon: str, en: str, hi: str) -> str:
+def _individual_section(
+    verse_ids: List[str],
+    collection_key: str,
+    icon: str,
+    en: str,
+    hi: str,
+    suffixes: Optional[List[Optional[str]]] = None,
+) -> str:
     count = len(verse_ids)
     count_en = f"{count} {'Verse' if count == 1 else 'Verses'}"
     count_hi = f"{count} पद"
 
-    cards = []
-    for vid in verse_ids:
+    # Invariant per section: the Liquid filter selecting this collection's verses
+    where_collection = f" | where: \"collection_key\", \"{collection_key}\""
+    out = [
+        f"\n"
+        f"    <h3>{icon}"
+        f" <span data-lang=\"en\">{en} ({count_en})</span>"
+        f"<span data-lang=\"hi\">{hi} ({count_hi})</span>"
+        f"</h3>\n"
+        f"    <div class=\"verse-grid\">\n"
+    ]
+    if suffixes is None:
+        suffixes = [_split_stem(vid)[1] for vid in verse_ids]
+    for vid, suffix in zip(verse_ids, suffixes):
         var = vid.replace("-", "_")
-        suffix = vid.rsplit("-", 1)[-1] if "-" in vid else ""
+        suffix = suffix or ""
         if suffix.isdigit():
             num = int(suffix)
             num_en = f"{en} {num}"
             num_hi = f"{hi} {num}"
         else:
-            q = _SUFFIX_QUALIFIERS.get(suffix, {
-                "en": suffix.replace("-", " ").title(),
-                "hi": suffix.replace("-", " ").title(),
-            })
-            num_en = f"{q['en']} {en}"
-            num_hi = f"{q['hi']} {hi}"
-
-        card = (
-            f"        {{% assign {var} = site.verses"
-            f" | where: \"collection_key\", \"{collection_key}\""
+            qual_en, qual_hi = _qualifier_labels(suffix)
+            num_en = f"{qual_en} {en}"
+            num_hi = f"{qual_hi} {hi}"
+
+        out.append(
+            f"        {{% assign {var} = site.verses{where_collection}"
             f" | where_exp: \"item\", \"item.url contains '{vid}'\" | first %}}\n"
             f"        {{% if {var} %}}\n"
             f"        {_card_block(var, num_en, num_hi)}\n"
-            f"        {{% endif %}}"
+            f"        {{% endif %}}\n"
         )
-        cards.append(card)
-
-    return (
-        f"\n"
-        f"    <h3>{icon}"
-        f" <span data-lang=\"en\">{en} ({count_en})</span>"
-        f"<span data-lang=\"hi\">{hi} ({count_hi})</span>"
-        f"</h3>\n"
-        f"    <div class=\"verse-grid\">\n"
-        + "\n".join(cards) + "\n"
-        "    </div>"
-    )
+    if not verse_ids:
+        out.append("\n")
+    out.append("    </div>")
+    return "".join(out)
 
 
+# Cards repeat across collections (same var and labels), so size for --all runs
+@functools.lru_cache(maxsize=1024)
 def _card_block(var: str, num_en: str, num_hi: str) -> str:
     """Liquid HTML for a verse card. var is the Liquid variable name."""
     return (
@@ -236,6 +279,18 @@ def _card_block(var: str, num_en: str, num_hi: str) -> str:
 # About section builder
 # ---------------------------------------------------------------------------
 
+_ABOUT_OPEN = (
+    '        <details class="about-section-compact">\n'
+    '            <summary>▶ <span data-lang="en">About</span>'
+    '<span data-lang="hi">परिचय</span></summary>\n'
+)
+_ABOUT_PLACEHOLDER = '            <!-- TODO: add description_en / description_hi to _data/collections.yml -->'
+_PURANIC_LEGEND_HTML = (
+    '        <span class="puranic-legend-compact">📚 <span data-lang="en">Some verses have Puranic stories</span>'
+    '<span data-lang="hi">कुछ पदों में पौराणिक कथाएं हैं</span></span>'
+)
+
+
 def _about_paragraphs(config: Dict, lang: str) -> List[str]:
     """Return list of paragraph strings for the given lang ('en' or 'hi')."""
     key = f"description_{lang}"
@@ -266,16 +321,10 @@ def _about_section(config: Dict) -> str:
             lines.append(f"            <p>{en_span}{hi_span}</p>")
 
     if not lines:
-        lines.append('            <!-- TODO: add description_en / description_hi to _data/collections.yml -->')
+        lines.append(_ABOUT_PLACEHOLDER)
 
     inner = "\n".join(lines)
-    return (
-        '        <details class="about-section-compact">\n'
-        '            <summary>▶ <span data-lang="en">About</span>'
-        '<span data-lang="hi">परिचय</span></summary>\n'
-        f"{inner}\n"
-        "        </details>"
-    )
+    return f"{_ABOUT_OPEN}{inner}\n        </details>"
 
 
 # ---------------------------------------------------------------------------
@@ -301,7 +350,9 @@ def generate_index_html(collection_key: str, config: Dict, sections: List[Dict])
         if section["is_loop"]:
             blocks.append(_loop_section(prefix, collection_key, icon, en, hi))
         else:
-            blocks.append(_individual_section(verse_ids, collection_key, icon, en, hi))
+            blocks.append(_individual_section(
+                verse_ids, collection_key, icon, en, hi, section.get("suffixes")
+            ))
 
     sections_html = "\n".join(blocks)
 
@@ -324,7 +375,7 @@ collection_key: {collection_key}
     </div>
     <div class="collection-meta">
 {about_html}
-        <span class="puranic-legend-compact">📚 <span data-lang="en">Some verses have Puranic stories</span><span data-lang="hi">कुछ पदों में पौराणिक कथाएं हैं</span></span>
+{_PURANIC_LEGEND_HTML}
     </div>
 </div>
 
@@ -339,7 +390,70 @@ def generate_full_text_html(collection_key: str, config: Dict) -> str:
     name_en = config.get("name_en", collection_key.replace("-", " ").title())
     name_hi = config.get("name_hi", "")
     permalink_base = config.get("permalink_base", f"/{collection_key}/").rstrip("/") + "/"
+    return _full_text_html(collection_key, str(name_en), str(name_hi), permalink_base)
+
+
+# Static Liquid/JS body of full-text.html; only the header varies per collection
+_FULL_TEXT_BODY = """<div class="full-text-page">
+    {% assign prev_type = "" %}
+    {% for verse in verses %}
+        {% if verse.verse_type != prev_type %}
+            {% unless prev_type == "" %}</div></div>{% endunless %}
+            <div class="verse-section">
+            <h3 class="section-header">
+                {% assign vt = verse.verse_type %}
+                {% if vt == "chaupai" %}<span data-lang="en">📿 Chaupais</span><span data-lang="hi">📿 चौपाई</span>
+                {% elsif vt == "doha" %}<span data-lang="en">🪷 Dohas</span><span data-lang="hi">🪷 दोहा</span>
+                {% elsif vt == "shloka" %}<span data-lang="en">📖 Shlokas</span><span data-lang="hi">📖 श्लोक</span>
+                {% elsif vt == "pada" %}<span data-lang="en">🎵 Padas</span><span data-lang="hi">🎵 पद</span>
+                {% else %}<span data-lang="en">{{ verse.verse_type | capitalize }}</span><span data-lang="hi">{{ verse.verse_type | capitalize }}</span>
+                {% endif %}
+            </h3>
+            <div class="full-text-verses">
+        {% endif %}
+        <div class="full-text-verse" id="{{ verse.slug }}">
+            <div class="verse-label">
+                <a href="{{ verse.url | relative_url }}">
+                    <span data-lang="en">{{ verse.title_en }}</span>
+                    <span data-lang="hi">{{ verse.title_hi }}</span>
+                </a>
+                {% if verse.puranic_context %}<span class="puranic-badge"><span class="badge-icon">📚</span></span>{% endif %}
+            </div>
+            <div class="devanagari-content">{{ verse.devanagari }}</div>
+            <div class="transliteration-content">{{ verse.transliteration }}</div>
+            <div class="translation-content">
+                {% if verse.translation.en %}<p class="translation-en" data-lang="en">{{ verse.translation.en }}</p>{% endif %}
+                {% if verse.translation.hi %}<p class="translation-hi" data-lang="hi">{{ verse.translation.hi }}</p>{% endif %}
+                {% if verse.interpretive_meaning.en %}<p class="meaning-en" data-lang="en">{{ verse.interpretive_meaning.en }}</p>{% endif %}
+            </div>
+            {% if verse.word_meanings.size > 0 %}
+            <div class="word-meanings-content">
+                <dl>
+                {% for wm in verse.word_meanings %}
+                    <dt>{{ wm.word }}</dt><dd><span data-lang="en">{{ wm.meaning_en }}</span><span data-lang="hi">{{ wm.meaning_hi }}</span></dd>
+                {% endfor %}
+                </dl>
+            </div>
+            {% endif %}
+        </div>
+        {% assign prev_type = verse.verse_type %}
+    {% endfor %}
+    {% unless prev_type == "" %}</div></div>{% endunless %}
+</div>
 
+<script>
+function toggleSection(cls, show) {
+    document.querySelectorAll('.' + cls + '-content').forEach(function(el) {
+        el.style.display = show ? '' : 'none';
+    });
+}
+</script>
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def _full_text_html(collection_key: str, name_en: str, name_hi: str, permalink_base: str) -> str:
+    """Render full-text.html; the page depends only on these four values."""
     return f"""---
 layout: default
 title: "Full Text – {name_en}"
@@ -363,142 +477,194 @@ collection_key: {collection_key}
     </div>
 </div>
 
-<div class="full-text-page">
-    {{% assign prev_type = "" %}}
-    {{% for verse in verses %}}
-        {{% if verse.verse_type != prev_type %}}
-            {{% unless prev_type == "" %}}</div></div>{{% endunless %}}
-            <div class="verse-section">
-            <h3 class="section-header">
-                {{% assign vt = verse.verse_type %}}
-                {{% if vt == "chaupai" %}}<span data-lang="en">📿 Chaupais</span><span data-lang="hi">📿 चौपाई</span>
-                {{% elsif vt == "doha" %}}<span data-lang="en">🪷 Dohas</span><span data-lang="hi">🪷 दोहा</span>
-                {{% elsif vt == "shloka" %}}<span data-lang="en">📖 Shlokas</span><span data-lang="hi">📖 श्लोक</span>
-                {{% elsif vt == "pada" %}}<span data-lang="en">🎵 Padas</span><span data-lang="hi">🎵 पद</span>
-                {{% else %}}<span data-lang="en">{{{{ verse.verse_type | capitalize }}}}</span><span data-lang="hi">{{{{ verse.verse_type | capitalize }}}}</span>
-                {{% endif %}}
-            </h3>
-            <div class="full-text-verses">
-        {{% endif %}}
-        <div class="full-text-verse" id="{{{{ verse.slug }}}}">
-            <div class="verse-label">
-                <a href="{{{{ verse.url | relative_url }}}}">
-                    <span data-lang="en">{{{{ verse.title_en }}}}</span>
-                    <span data-lang="hi">{{{{ verse.title_hi }}}}</span>
-                </a>
-                {{% if verse.puranic_context %}}<span class="puranic-badge"><span class="badge-icon">📚</span></span>{{% endif %}}
-            </div>
-            <div class="devanagari-content">{{{{ verse.devanagari }}}}</div>
-            <div class="transliteration-content">{{{{ verse.transliteration }}}}</div>
-            <div class="translation-content">
-                {{% if verse.translation.en %}}<p class="translation-en" data-lang="en">{{{{ verse.translation.en }}}}</p>{{% endif %}}
-                {{% if verse.translation.hi %}}<p class="translation-hi" data-lang="hi">{{{{ verse.translation.hi }}}}</p>{{% endif %}}
-                {{% if verse.interpretive_meaning.en %}}<p class="meaning-en" data-lang="en">{{{{ verse.interpretive_meaning.en }}}}</p>{{% endif %}}
-            </div>
-            {{% if verse.word_meanings.size > 0 %}}
-            <div class="word-meanings-content">
-                <dl>
-                {{% for wm in verse.word_meanings %}}
-                    <dt>{{{{ wm.word }}}}</dt><dd><span data-lang="en">{{{{ wm.meaning_en }}}}</span><span data-lang="hi">{{{{ wm.meaning_hi }}}}</span></dd>
-                {{% endfor %}}
-                </dl>
-            </div>
-            {{% endif %}}
-        </div>
-        {{% assign prev_type = verse.verse_type %}}
-    {{% endfor %}}
-    {{% unless prev_type == "" %}}</div></div>{{% endunless %}}
-</div>
-
-<script>
-function toggleSection(cls, show) {{
-    document.querySelectorAll('.' + cls + '-content').forEach(function(el) {{
-        el.style.display = show ? '' : 'none';
-    }});
-}}
-</script>
-"""
+{_FULL_TEXT_BODY}"""
 
 
 # ---------------------------------------------------------------------------
 # Project I/O
 # ---------------------------------------------------------------------------
 
-def load_collections(project_dir: Path) -> Dict:
+def _collections_path(project_dir: Path) -> Path:
+    """Return the path to collections.yml, exiting if it is missing."""
     path = project_dir / "_data" / "collections.yml"
-    if not path.exists():
+    if not path.is_file():
         print(f"Error: {path} not found", file=sys.stderr)
         sys.exit(1)
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return path
+
+
+def load_collections(project_dir: Path) -> Dict:
+    # PyYAML is imported on first use so --help and usage errors start fast
+    from verse_sdk.utils.yaml_parser import load_yaml_file
+
+    return load_yaml_file(_collections_path(project_dir)) or {}
 
 
 def _load_sequence(collection_key: str, project_dir: Path) -> Optional[List[str]]:
     """Read _meta.sequence from data/verses/{collection}.yaml if present."""
+    from verse_sdk.utils.yaml_parser import load_yaml_file
+
     for ext in ("yaml", "yml"):
         path = project_dir / "data" / "verses" / f"{collection_key}.{ext}"
-        if path.exists():
-            try:
-                with open(path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-                meta = data.get("_meta") or {}
-                seq = meta.get("sequence")
-                if isinstance(seq, list):
-                    return [str(v) for v in seq]
-            except Exception:
-                pass
+        try:
+            # Only _meta.sequence is read, so skip copying the whole verse file
+            data = load_yaml_file(path, copy_result=False) or {}
+            seq = (data.get("_meta") or {}).get("sequence")
+        except OSError:
+            continue
+        except Exception:
+            seq = None
+        if isinstance(seq, list):
+            return [str(v) for v in seq]
     return None
 
 
-def scaffold_collection(collection_key: str, project_dir: Path, overwrite: bool = False) -> bool:
+def _write_output(path: str, content: str, overwrite: bool) -> bool:
+    """
+    Write fully rendered content to an output file, creating its parent directory.
+
+    Without overwrite the file is created exclusively and False is returned if
+    it already exists. With overwrite the content goes to a temporary file that
+    replaces the old page in one step, so a failure never leaves it truncated.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if not overwrite:
+        try:
+            fh = open(path, "x", encoding="utf-8")
+        except FileExistsError:
+            return False
+        try:
+            with fh:
+                fh.write(content)
+        except BaseException:
+            os.remove(path)
+            raise
+        return True
+
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return True
+
+
+def _skip_message(path: str) -> str:
+    return f"  ⚠ Skipped {path} (already exists — use --overwrite to regenerate)"
+
+
+def scaffold_collection(
+    collection_key: str,
+    project_dir: Path,
+    overwrite: bool = False,
+    collections: Optional[Dict] = None,
+    log: Callable[..., None] = print,
+) -> bool:
     """
     Generate index.html and full-text.html for one collection. Returns True on success.
+
+    Pass an already loaded ``collections`` mapping to skip re-checking
+    _data/collections.yml (e.g. when scaffolding every collection).
+    Progress messages go through ``log``, which takes print()'s arguments.
     """
-    collections = load_collections(project_dir)
-    if collection_key not in collections:
-        print(f"Error: '{collection_key}' not found in _data/collections.yml", file=sys.stderr)
-        return False
+    if collections is not None:
+        config = collections.get(collection_key)
+        if config is None:
+            log(f"Error: '{collection_key}' not found in _data/collections.yml", file=sys.stderr)
+            return False
+    else:
+        from verse_sdk.utils.yaml_parser import load_yaml_file
+
+        config = (load_yaml_file(_collections_path(project_dir), copy_result=False) or {}).get(collection_key)
+        if config is None:
+            log(f"Error: '{collection_key}' not found in _data/collections.yml", file=sys.stderr)
+            return False
+        config = copy.deepcopy(config)
 
-    config = collections[collection_key]
     permalink_base = config.get("permalink_base", f"/{collection_key}/")
     output_dir_name = permalink_base.strip("/")
-    output_dir = project_dir / output_dir_name
-    output_file = output_dir / "index.html"
+    pd = os.fspath(project_dir)
+    output_dir = os.path.join(pd, output_dir_name)
+    output_file = os.path.join(output_dir, "index.html")
 
-    if output_file.exists() and not overwrite:
-        print(f"  ⚠ Skipped {output_file} (already exists — use --overwrite to regenerate)")
+    if not overwrite and os.path.exists(output_file):
+        log(_skip_message(output_file))
     else:
-        verses_dir = project_dir / "_verses" / collection_key
+        verses_dir = os.path.join(pd, "_verses", collection_key)
         sequence = _load_sequence(collection_key, project_dir)
         sections = detect_sections(verses_dir, sequence=sequence)
 
         if not sections:
-            print(f"  ⚠ No verse files found in {verses_dir} — generating template with empty sections")
+            log(f"  ⚠ No verse files found in {verses_dir} — generating template with empty sections")
 
+        # Render before touching the file so a failure can't leave a stub page behind
         html = generate_index_html(collection_key, config, sections)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html, encoding="utf-8")
-
-        verse_count = sum(len(s["verse_ids"]) for s in sections)
-        section_count = len(sections)
-        print(f"  ✓ Wrote {output_file} ({section_count} section(s), {verse_count} verse(s))")
+        if _write_output(output_file, html, overwrite):
+            verse_count = sum(len(s["verse_ids"]) for s in sections)
+            section_count = len(sections)
+            log(f"  ✓ Wrote {output_file} ({section_count} section(s), {verse_count} verse(s))")
+        else:
+            log(_skip_message(output_file))
 
-    _scaffold_full_text(collection_key, config, output_dir, overwrite)
+    _scaffold_full_text(collection_key, config, output_dir, overwrite, log)
     return True
 
 
 def _scaffold_full_text(
-    collection_key: str, config: Dict, output_dir: Path, overwrite: bool
+    collection_key: str, config: Dict, output_dir: str, overwrite: bool,
+    log: Callable[..., None] = print,
 ) -> None:
     """Write full-text.html alongside index.html."""
-    full_text_file = output_dir / "full-text.html"
-    if full_text_file.exists() and not overwrite:
-        print(f"  ⚠ Skipped {full_text_file} (already exists — use --overwrite to regenerate)")
+    full_text_file = os.path.join(output_dir, "full-text.html")
+    if not overwrite and os.path.exists(full_text_file):
+        log(_skip_message(full_text_file))
         return
-    html = generate_full_text_html(collection_key, config)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    full_text_file.write_text(html, encoding="utf-8")
-    print(f"  ✓ Wrote {full_text_file}")
+    if _write_output(full_text_file, generate_full_text_html(collection_key, config), overwrite):
+        log(f"  ✓ Wrote {full_text_file}")
+    else:
+        log(_skip_message(full_text_file))
+
+
+def scaffold_many(
+    keys: List[str],
+    project_dir: Path,
+    overwrite: bool = False,
+    max_workers: int = 8,
+    collections: Optional[Dict] = None,
+) -> List[bool]:
+    """
+    Scaffold several collections concurrently (the work is file I/O bound).
+
+    Returns one success flag per key, in the order given. Each collection's
+    messages are held back and printed together, also in key order.
+    """
+    if collections is None:
+        collections = load_collections(project_dir)
+
+    if len(keys) <= 1:
+        return [scaffold_collection(k, project_dir, overwrite=overwrite, collections=collections) for k in keys]
+
+    def scaffold(key: str) -> Tuple[bool, List]:
+        messages = []
+        ok = scaffold_collection(
+            key, project_dir, overwrite=overwrite, collections=collections,
+            log=lambda *args, **kwargs: messages.append((args, kwargs)),
+        )
+        return ok, messages
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        # map() yields in key order, so each collection prints once it and
+        # every collection before it have finished
+        for ok, messages in ex.map(scaffold, keys):
+            for args, kwargs in messages:
+                print(*args, **kwargs)
+            results.append(ok)
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -543,8 +709,7 @@ Examples:
             print("No enabled collections found in _data/collections.yml")
             sys.exit(0)
         print(f"Scaffolding {len(keys)} collection(s)...")
-        for key in keys:
-            scaffold_collection(key, project_dir, overwrite=args.overwrite)
+        scaffold_many(keys, project_dir, overwrite=args.overwrite, collections=collections)
     else:
         scaffold_collection(args.collection, project_dir, overwrite=args.overwrite)
 
@@ -25,16 +25,21 @@ Requirements:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import mmap
 import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-import yaml
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
 
 from verse_sdk.utils.embeddings_config import load_embeddings_config, resolve_with_precedence
 from verse_sdk.utils.file_utils import find_puranic_embeddings_path
+from verse_sdk.utils.yaml_parser import dump_yaml, extract_yaml_frontmatter, load_yaml, load_yaml_file
 
 try:
     from dotenv import load_dotenv
@@ -44,50 +49,51 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from openai import OpenAI
+    import simsimd  # optional SIMD kernels for embedding similarity
 except ImportError:
-    print("Error: openai package not installed")
-    print("Install with: pip install openai")
-    sys.exit(1)
+    simsimd = None
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
-load_dotenv()
+# Clients are shared across verses (and worker threads) so HTTP connections
+# and loaded models are reused instead of rebuilt per verse
+_client_lock = threading.Lock()
+_openai_client: Optional["OpenAI"] = None
+_embedding_providers: Dict[str, Tuple] = {}
 
 VALID_TYPES = {"story", "concept", "character", "etymology", "practice", "cross_reference"}
 VALID_PRIORITIES = {"high", "medium", "low"}
 
+# Generated entries keyed by prompt hash, relative to the project directory
+PURANIC_CACHE_DIR = Path(".cache") / "puranic"
+
 SYSTEM_PROMPT = """You are an expert in Hindu scriptures, Puranas, and devotional literature
 (bhakti). You generate structured Puranic context boxes for verses from sacred texts like
 Hanuman Chalisa, Sundar Kaand, Bajrang Baan, and Sankat Mochan Hanumanashtak.
 
-Each context entry must be a YAML object with these fields:
-  id: unique-slug (kebab-case)
-  type: story | concept | character | etymology | practice | cross_reference
-  priority: high | medium | low
-  title:
-    en: "English title"
-    hi: "Hindi title in Devanagari"
-  icon: single emoji
-  story_summary:
-    en: "2-4 sentence summary"
-    hi: "Same in Hindi Devanagari"
-  theological_significance:
-    en: "2-4 sentences on spiritual meaning"
-    hi: "Same in Hindi Devanagari"
-  practical_application:
-    en: "2-4 sentences on practical use"
-    hi: "Same in Hindi Devanagari"
-  source_texts:
-    - text: "Scripture name"
-      section: "Book/chapter/kanda"
-  related_verses: []
+Respond with a JSON object of the form {"entries": [...]}. Each context entry is an
+object with these fields:
+  {
+    "id": "unique-slug (kebab-case)",
+    "type": "story | concept | character | etymology | practice | cross_reference",
+    "priority": "high | medium | low",
+    "title": {"en": "English title", "hi": "Hindi title in Devanagari"},
+    "icon": "single emoji",
+    "story_summary": {"en": "2-4 sentence summary", "hi": "Same in Hindi Devanagari"},
+    "theological_significance": {"en": "2-4 sentences on spiritual meaning", "hi": "Same in Hindi Devanagari"},
+    "practical_application": {"en": "2-4 sentences on practical use", "hi": "Same in Hindi Devanagari"},
+    "source_texts": [{"text": "Scripture name", "section": "Book/chapter/kanda"}],
+    "related_verses": []
+  }
 
 Rules:
 - Generate 1-3 entries per verse (only the most relevant references)
 - For short invocations, closing verses, or verses with no meaningful Puranic
-  content, return an empty list []
+  content, return {"entries": []}
 - Prioritise accuracy over quantity
 - All Hindi text must be in Devanagari script
-- Return ONLY valid YAML — no markdown fences, no explanation
+- Return ONLY the JSON object — no markdown fences, no explanation
 - CITATION RULES (strictly enforced):
   * Every entry MUST have a genuine section reference (e.g. "Rudrasamhita, Chapter 12")
     sourced from the retrieved episode metadata provided below
@@ -95,7 +101,7 @@ Rules:
     vague placeholder — omit the entire entry instead
   * Do NOT cite scriptures that were not provided in the retrieved episodes
     (e.g. do not cite Ramayana or Mahabharata unless those episodes were retrieved)
-  * If no retrieved episode provides a direct, citable reference for an entry, return []
+  * If no retrieved episode provides a direct, citable reference for an entry, return {"entries": []}
   * Do NOT generate entries from your general knowledge or other scriptures —
     every entry must be derivable from the episodes listed above
 """
@@ -105,28 +111,56 @@ Rules:
 # File I/O helpers
 # ---------------------------------------------------------------------------
 
-def parse_verse_file(verse_file: Path) -> Tuple[Optional[Dict], Optional[str]]:
-    """Parse verse frontmatter and body. Returns (frontmatter, body)."""
+def parse_verse_file(verse_file: Path, with_body: bool = True) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Parse verse frontmatter and body. Returns (frontmatter, body).
+
+    With ``with_body=False`` reading stops at the closing ``---`` and body is None.
+    """
     if not verse_file.exists():
         return None, None
     try:
+        if not with_body:
+            return extract_yaml_frontmatter(verse_file) or {}, None
         content = verse_file.read_text(encoding='utf-8')
         if not content.startswith('---'):
             return {}, content
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        end = content.find('---', 3)
+        if end == -1:
             return {}, content
-        return yaml.safe_load(parts[1]) or {}, parts[2]
+        return load_yaml(content[3:end]) or {}, content[end + 3:]
     except Exception as e:
         print(f"  ✗ Error parsing {verse_file.name}: {e}", file=sys.stderr)
         return None, None
 
 
+# A top-level puranic_context key followed by a block list item, as dump_yaml writes it
+_HAS_CONTEXT_RE = re.compile(rb"^puranic_context:[ \t]*\r?\n[ \t]*- ", re.MULTILINE)
+
+
+def _has_puranic_context(verse_file: Path) -> bool:
+    """
+    Cheap check for a non-empty puranic_context list in the frontmatter, without parsing YAML.
+
+    False means "not sure": flow-style or empty values are left to the full parse.
+    """
+    try:
+        with open(verse_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:3] != b"---":
+                return False
+            end = mm.find(b"\n---", 3)
+            if end == -1:
+                return False
+            return _HAS_CONTEXT_RE.search(mm, 3, end + 1) is not None
+    except (OSError, ValueError):  # missing or empty file
+        return False
+
+
 def update_verse_file(verse_file: Path, frontmatter: Dict, body: str) -> bool:
     """Write updated frontmatter back to verse file."""
     try:
         content = "---\n"
-        content += yaml.dump(frontmatter, allow_unicode=True, sort_keys=False,
+        content += dump_yaml(frontmatter, allow_unicode=True, sort_keys=False,
                              default_flow_style=False)
         content += "---"
         content += body
@@ -137,6 +171,63 @@ def update_verse_file(verse_file: Path, frontmatter: Dict, body: str) -> bool:
         return False
 
 
+def patch_frontmatter(verse_file: Path, updates: Dict, frontmatter: Optional[Dict] = None) -> bool:
+    """
+    Splice updated top-level keys into a verse file's frontmatter in place.
+
+    Only the lines of the updated keys are re-emitted; every other key and
+    the body are kept byte for byte. Pass the already-parsed ``frontmatter``
+    (with the updates applied) to skip re-parsing the file's current header.
+    Returns False when the file cannot be patched safely, in which case the
+    caller should fall back to update_verse_file().
+    """
+    try:
+        raw = verse_file.read_bytes()
+        end = raw.find(b"---", 4)
+        if not raw.startswith(b"---\n") or end < 0 or raw[end - 1:end] != b"\n":
+            return False
+        head = raw[4:end].decode("utf-8")
+        lines = head.splitlines(keepends=True)
+        for key, value in updates.items():
+            block = dump_yaml({key: value}, allow_unicode=True, sort_keys=False,
+                              default_flow_style=False)
+            prefix = f"{key}:"
+            start = next((i for i, line in enumerate(lines) if line.startswith(prefix)), None)
+            if start is None:
+                lines.append(block)
+                continue
+            # The value runs over indented / "- " lines. Blank and comment lines
+            # only belong to it when more value lines follow them.
+            stop = start + 1
+            scan = stop
+            while scan < len(lines):
+                lead = lines[scan][:1]
+                if lead in (" ", "\t", "-"):
+                    stop = scan = scan + 1
+                elif lead in ("#", "\n", "\r"):
+                    scan += 1
+                else:
+                    break
+            lines[start:stop] = [block]
+        new_head = "".join(lines)
+
+        # Only keep the splice if it parses to exactly the intended mapping
+        if frontmatter is None:
+            expected = load_yaml(head) or {}
+            if not isinstance(expected, dict):
+                return False
+            expected.update(updates)
+        else:
+            expected = frontmatter
+        if load_yaml(new_head) != expected:
+            return False
+
+        verse_file.write_bytes(raw[:4] + new_head.encode("utf-8") + raw[end:])
+        return True
+    except Exception:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # RAG helpers
 # ---------------------------------------------------------------------------
@@ -150,8 +241,7 @@ def load_project_defaults(project_dir: Path) -> Dict:
     if not config_file.exists():
         return {}
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml_file(config_file) or {}
         return data.get("defaults") or {}
     except Exception as e:
         print(f"  Warning: Could not read verse-config.yml: {e}", file=sys.stderr)
@@ -170,8 +260,7 @@ def load_collection_subject(collection_key: str, project_dir: Path) -> Tuple[Opt
     collections_file = project_dir / "_data" / "collections.yml"
     if collections_file.exists():
         try:
-            with open(collections_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml_file(collections_file) or {}
             config = data.get(collection_key, {})
             if isinstance(config, dict):
                 subject = config.get("subject") or None
@@ -194,8 +283,7 @@ def load_puranic_references(project_dir: Path) -> Dict:
     if not ref_file.exists():
         return {}
     try:
-        with open(ref_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml_file(ref_file) or {}
         return {k: v for k, v in data.items() if v.get("enabled", False)}
     except Exception as e:
         print(f"  Warning: Could not load puranic-references.yml: {e}", file=sys.stderr)
@@ -209,7 +297,7 @@ def load_index_meta(key: str, project_dir: Path) -> Optional[Dict]:
         return None
     try:
         with open(index_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         if isinstance(data, dict):
             return data.get("_meta")
         return None
@@ -225,10 +313,12 @@ def load_episode_index(key: str, project_dir: Path) -> List[Dict]:
         return []
     try:
         with open(index_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         if isinstance(data, dict):
-            return data.get("episodes") or []
-        return data or []  # legacy: bare list
+            episodes = data.get("episodes") or []
+        else:
+            episodes = data or []  # legacy: bare list
+        return episodes
     except Exception as e:
         print(f"  Warning: Could not load episode index for '{key}': {e}", file=sys.stderr)
         return []
@@ -283,14 +373,133 @@ def provider_from_model(model: str) -> str:
 
 
 def cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Dot product of two L2-normalised vectors (Cohere embeddings are normalised)."""
+    """
+    Cosine similarity of two embedding vectors.
+
+    Stored embeddings are L2-normalised, so this equals their dot product.
+    Uses SimSIMD when installed, otherwise NumPy.
+    """
     try:
         import numpy as np
-        return float(np.dot(a, b))
     except ImportError:
         # Pure-Python fallback
         dot = sum(x * y for x, y in zip(a, b))
-        return dot
+        norm = (sum(x * x for x in a) * sum(y * y for y in b)) ** 0.5
+        return dot / norm if norm else 0.0
+
+    if simsimd is not None:
+        a32 = a if isinstance(a, np.ndarray) and a.dtype == np.float32 else np.asarray(a, dtype=np.float32)
+        b32 = b if isinstance(b, np.ndarray) and b.dtype == np.float32 else np.asarray(b, dtype=np.float32)
+        return 1.0 - float(simsimd.cosine(a32, b32))
+
+    a = np.asarray(a)
+    b = np.asarray(b)
+    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(a @ b / norm) if norm else 0.0
+
+
+def cosine_similarity_batch(query, candidates):
+    """
+    Cosine similarity of one query vector against each row of a candidate matrix.
+
+    Normalises the rows and the query, then scores every candidate with a
+    single matrix-vector product. Zero rows score 0.0.
+    """
+    import numpy as np
+
+    candidates = np.asarray(candidates, dtype=np.float32)
+    query = np.asarray(query, dtype=np.float32)
+    if candidates.ndim != 2 or not len(candidates):
+        return np.zeros(len(candidates), dtype=np.float32)
+
+    row_norms = np.linalg.norm(candidates, axis=1, keepdims=True)
+    row_norms[row_norms == 0] = 1.0
+    query_norm = np.linalg.norm(query) or 1.0
+    return (candidates / row_norms) @ (query / query_norm)
+
+
+# Below this many candidates a GPU matmul doesn't beat the CPU one
+_GPU_MIN_CANDIDATES = 2048
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_torch():
+    """Return torch when it is installed and a CUDA device is available, else None."""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch if torch.cuda.is_available() else None
+
+
+class EpisodeCorpus:
+    """
+    Indexed episodes paired with their embeddings, prepared once for many searches.
+
+    Rows are L2-normalised up front. For large corpora on a CUDA machine the
+    matrix is uploaded to the GPU on first use and reused by later queries.
+    """
+
+    def __init__(self, all_episodes: List[Dict], all_embeddings: List[Dict]):
+        import numpy as np
+
+        emb_by_id: Dict[str, List[float]] = {
+            e["id"]: e["embedding"] for e in all_embeddings if "id" in e and "embedding" in e
+        }
+        self.episodes = [ep for ep in all_episodes if ep.get("id", "") in emb_by_id]
+        matrix = np.asarray(
+            [emb_by_id[ep.get("id", "")] for ep in self.episodes], dtype=np.float32
+        ).reshape(len(self.episodes), -1 if self.episodes else 0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+        self._device_matrix = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.episodes)
+
+    def device_matrix(self):
+        """The normalised matrix on the GPU, or None when CUDA isn't available."""
+        torch = _cuda_torch()
+        if torch is None:
+            return None
+        with self._lock:
+            if self._device_matrix is None:
+                self._device_matrix = torch.from_numpy(self.matrix).cuda()
+            return self._device_matrix
+
+    def search(self, query_embedding: List[float], top_k: int = 8) -> List[Dict]:
+        """Return the top-k episodes by cosine similarity to the query embedding."""
+        return [self.episodes[i] for i in retrieve_topk_gpu(query_embedding, self, top_k)]
+
+
+def retrieve_topk_gpu(query, corpus: EpisodeCorpus, k: int) -> List[int]:
+    """
+    Indices of the k corpus rows most cosine-similar to the query, best first.
+
+    Large corpora are scored with a matmul + topk against the corpus's cached
+    GPU matrix when PyTorch and CUDA are available; everything else uses a
+    NumPy matrix-vector product with a stable sort.
+    """
+    import numpy as np
+
+    k = min(k, len(corpus))
+    if k <= 0:
+        return []
+
+    query = np.asarray(query, dtype=np.float32)
+    query_norm = np.linalg.norm(query) or 1.0
+    query = query / query_norm
+
+    device_matrix = corpus.device_matrix() if len(corpus) >= _GPU_MIN_CANDIDATES else None
+    if device_matrix is not None:
+        torch = _cuda_torch()
+        scores = device_matrix @ torch.from_numpy(query).to(device_matrix.device)
+        return torch.topk(scores, k).indices.cpu().tolist()
+
+    scores = corpus.matrix @ query
+    return np.argsort(-scores, kind="stable")[:k].tolist()
 
 
 def search_episodes(
@@ -298,23 +507,27 @@ def search_episodes(
     all_episodes: List[Dict],
     all_embeddings: List[Dict],
     top_k: int = 8,
+    corpus: Optional[EpisodeCorpus] = None,
 ) -> List[Dict]:
-    """Return the top-k episodes by cosine similarity to the query embedding."""
-    # Build a lookup from episode id → embedding vector
-    emb_by_id: Dict[str, List[float]] = {
-        e["id"]: e["embedding"] for e in all_embeddings if "id" in e and "embedding" in e
-    }
+    """
+    Return the top-k episodes by cosine similarity to the query embedding.
+
+    Pass a prebuilt ``corpus`` to reuse it across verses; otherwise one is
+    built from all_episodes and all_embeddings for this call.
+    """
+    if corpus is None:
+        corpus = EpisodeCorpus(all_episodes, all_embeddings)
+    return corpus.search(query_embedding, top_k)
 
-    scored = []
-    for ep in all_episodes:
-        ep_id = ep.get("id", "")
-        if ep_id not in emb_by_id:
-            continue
-        score = cosine_similarity(query_embedding, emb_by_id[ep_id])
-        scored.append((score, ep))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [ep for _, ep in scored[:top_k]]
+def _episode_search_text(ep: Dict) -> str:
+    """Lowercased id, keywords and summaries of an episode, as one haystack."""
+    return " ".join([
+        str(ep.get("id") or ""),
+        " ".join(str(k) for k in ep.get("keywords") or []),
+        str(ep.get("summary_en") or ""),
+        str(ep.get("summary_hi") or ""),
+    ]).lower()
 
 
 def filter_episodes_by_subject(episodes: List[Dict], subject: str) -> List[Dict]:
@@ -325,17 +538,12 @@ def filter_episodes_by_subject(episodes: List[Dict], subject: str) -> List[Dict]
     so the generation prompt can still apply the constraint.
     """
     tokens = [t.lower() for t in subject.split()]
+    if not tokens:
+        return episodes
+    # One alternation scans each haystack once for all subject tokens
+    pattern = re.compile("|".join(re.escape(t) for t in tokens))
 
-    def matches(ep: Dict) -> bool:
-        haystack = " ".join([
-            ep.get("id", ""),
-            " ".join(ep.get("keywords", [])),
-            ep.get("summary_en", ""),
-            ep.get("summary_hi", ""),
-        ]).lower()
-        return any(token in haystack for token in tokens)
-
-    filtered = [ep for ep in episodes if matches(ep)]
+    filtered = [ep for ep in episodes if pattern.search(_episode_search_text(ep))]
     return filtered if filtered else episodes
 
 
@@ -347,7 +555,7 @@ def embed_verse_for_search(
     Returns the embedding vector or None on failure.
     """
     try:
-        from verse_sdk.embeddings.generate_embeddings import get_bedrock_embedding, initialize_provider
+        from verse_sdk.embeddings.generate_embeddings import get_bedrock_embedding
     except ImportError as e:
         print(f"  Warning: Could not import embedding module: {e}", file=sys.stderr)
         return None
@@ -370,7 +578,7 @@ def embed_verse_for_search(
     text = " ".join(parts)
 
     try:
-        embed_fn, client, config = initialize_provider(provider)
+        embed_fn, client, config = _get_embedding_provider(provider)
         backend = config.get("backend", "openai")
         if backend == "bedrock":
             return get_bedrock_embedding(text, client, config, input_type="search_query")
@@ -383,6 +591,28 @@ def embed_verse_for_search(
         return None
 
 
+def _get_openai_client() -> "OpenAI":
+    """Return the shared OpenAI chat client, creating it on first use."""
+    global _openai_client
+    with _client_lock:
+        if _openai_client is None:
+            # Imported here so --help and error exits don't pay for openai/httpx
+            from openai import OpenAI
+
+            _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return _openai_client
+
+
+def _get_embedding_provider(provider: str) -> Tuple:
+    """Return the shared (embed_fn, client, config) for an embedding provider."""
+    from verse_sdk.embeddings.generate_embeddings import initialize_provider
+
+    with _client_lock:
+        if provider not in _embedding_providers:
+            _embedding_providers[provider] = initialize_provider(provider)
+        return _embedding_providers[provider]
+
+
 def format_retrieved_episodes(episodes: List[Dict]) -> str:
     """Format retrieved episodes into a readable context block for the prompt."""
     if not episodes:
@@ -439,12 +669,12 @@ Transliteration: {transliteration}
         prompt += f"\nStory/Context: {story_text}\n"
 
     prompt += """
-Generate Puranic context entries for this verse as a YAML list.
-Return [] if the verse has no meaningful Puranic content."""
+Generate Puranic context entries for this verse as a JSON object with an "entries" list.
+Return {"entries": []} if the verse has no meaningful Puranic content."""
     return prompt
 
 
-_VAGUE_SECTIONS = {
+_VAGUE_SECTIONS = frozenset({
     "not directly mentioned", "not mentioned", "not explicitly mentioned",
     "not directly cited", "not explicitly cited",
     "not directly applicable", "not directly applicable",
@@ -452,7 +682,9 @@ _VAGUE_SECTIONS = {
     "not directly stated", "not explicitly stated",
     "unknown", "various", "n/a", "na", "none", "unclear",
     "unspecified", "not specified", "not available", "not applicable",
-}
+})
+# Sections longer than every placeholder can skip the lower() + set lookup
+_VAGUE_MAX_LEN = max(map(len, _VAGUE_SECTIONS))
 
 
 def _reject_uncited_entries(
@@ -464,37 +696,38 @@ def _reject_uncited_entries(
     - A missing or vague section (placeholder phrases or bare numbers), OR
     - A source name not found in the indexed sources (cross-scripture hallucination).
     """
-    allowed_names: Optional[set] = None
+    allowed_names: Optional[frozenset] = None
     if indexed_source_names:
-        allowed_names = {n.lower() for n in indexed_source_names}
+        allowed_names = frozenset(n.lower() for n in indexed_source_names)
+    is_vague = _VAGUE_SECTIONS.__contains__
 
     kept = []
+    keep = kept.append
     for entry in entries:
-        source_texts = entry.get("source_texts") or []
         valid = []
-        for s in source_texts:
+        add_valid = valid.append
+        for s in entry.get("source_texts") or ():
             if not isinstance(s, dict):
                 continue
             section = str(s.get("section", "")).strip()
-            # Reject vague/placeholder sections
-            if section == "" or section.lower() in _VAGUE_SECTIONS:
-                continue
-            # Reject bare numeric sections ("71" alone — no Purana name)
-            if section.isdigit():
+            # Reject vague/placeholder sections and bare numbers ("71" alone — no Purana name)
+            if not section or section.isdigit() or (
+                len(section) <= _VAGUE_MAX_LEN and is_vague(section.lower())
+            ):
                 continue
             # Reject if cited text is not one of the indexed sources
             if allowed_names is not None:
                 text_name = str(s.get("text", "")).strip().lower()
-                if text_name and not any(
+                if text_name and text_name not in allowed_names and not any(
                     allowed in text_name or text_name in allowed
                     for allowed in allowed_names
                 ):
                     continue
-            valid.append(s)
+            add_valid(s)
 
         if valid:
             entry["source_texts"] = valid
-            kept.append(entry)
+            keep(entry)
         else:
             ep_id = entry.get("id", "?")
             print(f"    ⚠ Dropped entry '{ep_id}': no citable section reference from indexed sources", file=sys.stderr)
@@ -559,6 +792,42 @@ def _filter_by_subject_participation(
     return kept
 
 
+def _response_cache_enabled() -> bool:
+    """The response cache is opt-in, since it writes files into the project."""
+    return os.getenv('PURANIC_RESPONSE_CACHE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _cached_entries_path(cache_dir: Path, system: str, prompt: str) -> Path:
+    """Cache file for one request; the key covers the model and every prompt input."""
+    key = hashlib.sha256(f"gpt-4o\0{system}\0{prompt}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _read_cached_entries(path: Path) -> Optional[List]:
+    """Return cached entries, or None when missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entries if isinstance(entries, list) else None
+
+
+def _write_cached_entries(path: Path, entries: List) -> None:
+    """Best-effort atomic write of generated entries; failures only cost a cache miss."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
 def generate_puranic_context(
     frontmatter: Dict,
     verse_id: str,
@@ -566,9 +835,16 @@ def generate_puranic_context(
     indexed_source_names: Optional[List[str]] = None,
     subject: Optional[str] = None,
     subject_type: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    refresh_cache: bool = False,
 ) -> Optional[List]:
-    """Call GPT-4o to generate puranic_context entries. Returns a list or None on error."""
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    """
+    Call GPT-4o to generate puranic_context entries. Returns a list or None on error.
+
+    With ``cache_dir``, results are stored under a hash of the full prompt and
+    an identical request is answered from disk without calling the API.
+    ``refresh_cache`` always calls the API and overwrites the cached result.
+    """
     prompt = build_prompt(frontmatter, verse_id)
 
     system = SYSTEM_PROMPT
@@ -582,6 +858,15 @@ def generate_puranic_context(
         label = f"{subject_type} {subject}" if subject_type else subject
         system += f"\n\nIMPORTANT: Only include context entries that directly involve {label} as a primary or secondary participant, or that are theologically necessary to understand this verse about {label}. Omit entries about other deities or figures unless they directly interact with {label} in the episode."
 
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = _cached_entries_path(cache_dir, system, prompt)
+        cached = None if refresh_cache else _read_cached_entries(cache_file)
+        if cached is not None:
+            print(f"    → {verse_id}: Using cached response ({cache_file.name[:12]}…)", file=sys.stderr)
+            return cached
+
+    client = _get_openai_client()
     try:
         response = client.chat.completions.create(
             model="gpt-4o",
@@ -590,20 +875,13 @@ def generate_puranic_context(
                 {"role": "user", "content": prompt},
             ],
             temperature=0.3,
+            # JSON mode guarantees a parseable object, so no fence stripping is needed
+            response_format={"type": "json_object"},
         )
-        raw = response.choices[0].message.content.strip()
-
-        # Strip accidental markdown fences
-        if raw.startswith("```"):
-            raw = "\n".join(raw.split("\n")[1:])
-        if raw.endswith("```"):
-            raw = "\n".join(raw.split("\n")[:-1])
-
-        parsed = yaml.safe_load(raw)
-        if parsed is None:
-            return []
+        parsed = json.loads(response.choices[0].message.content)
+        parsed = parsed.get("entries") if isinstance(parsed, dict) else None
         if not isinstance(parsed, list):
-            print("  ⚠ Unexpected response format (not a list)", file=sys.stderr)
+            print("  ⚠ Unexpected response format (no entries list)", file=sys.stderr)
             return None
 
         # Fix 1+3: reject vague sections and cross-scripture citations
@@ -615,10 +893,12 @@ def generate_puranic_context(
             print(f"    → Validating subject participation for {len(result)} entr{'y' if len(result) == 1 else 'ies'}...", file=sys.stderr)
             result = _filter_by_subject_participation(result, subject, label, client)
 
+        if cache_file is not None:
+            _write_cached_entries(cache_file, result)
         return result
 
-    except yaml.YAMLError as e:
-        print(f"  ✗ YAML parse error in AI response: {e}", file=sys.stderr)
+    except json.JSONDecodeError as e:
+        print(f"  ✗ JSON parse error in AI response: {e}", file=sys.stderr)
         return None
     except Exception as e:
         print(f"  ✗ API error: {e}", file=sys.stderr)
@@ -629,6 +909,40 @@ def generate_puranic_context(
 # Core processing
 # ---------------------------------------------------------------------------
 
+class RagIndex(NamedTuple):
+    """Embedding provider and searchable episodes for the indexed sources."""
+    provider: str
+    corpus: Optional[EpisodeCorpus]  # None when no episodes/embeddings are indexed
+
+
+def load_rag_index(
+    sources: Dict,
+    project_dir: Path,
+    embeddings_dir_override: Optional[Path] = None,
+) -> RagIndex:
+    """Load every indexed source's episodes and embeddings into one RagIndex."""
+    # Detect provider from _meta in index file (authoritative), fall back to embeddings JSON
+    provider = "openai"
+    for key in sources:
+        meta = load_index_meta(key, project_dir)
+        if meta and meta.get("embedding_provider"):
+            provider = meta["embedding_provider"]
+            break
+        model = load_embeddings_model(key, project_dir, embeddings_dir_override=embeddings_dir_override)
+        if model:
+            provider = provider_from_model(model)
+            break
+
+    all_episodes: List[Dict] = []
+    all_embeddings: List[Dict] = []
+    for key in sources:
+        all_episodes.extend(load_episode_index(key, project_dir))
+        all_embeddings.extend(load_episode_embeddings(key, project_dir, embeddings_dir_override=embeddings_dir_override))
+
+    corpus = EpisodeCorpus(all_episodes, all_embeddings) if all_episodes and all_embeddings else None
+    return RagIndex(provider, corpus)
+
+
 def process_verse(
     verse_file: Path,
     regenerate: bool = False,
@@ -636,20 +950,31 @@ def process_verse(
     subject: Optional[str] = None,
     subject_type: Optional[str] = None,
     embeddings_dir_override: Optional[Path] = None,
+    rag: Optional[RagIndex] = None,
+    cache_dir: Optional[Path] = None,
 ) -> str:
     """
     Process a single verse file.
 
+    Pass a preloaded ``rag`` index when processing many verses; otherwise the
+    indexed sources are loaded for this verse. ``cache_dir`` is passed on to
+    generate_puranic_context; with ``regenerate`` cached responses are not reused.
+
     Returns: 'added' | 'skipped' | 'regenerated' | 'empty' | 'error'
     """
     if project_dir is None:
         project_dir = Path.cwd()
 
-    frontmatter, body = parse_verse_file(verse_file)
+    verse_id = verse_file.stem
+    if not regenerate and _has_puranic_context(verse_file):
+        print(f"  ⊘ {verse_id}: Already has puranic_context, skipping (use --regenerate to overwrite)")
+        return 'skipped'
+
+    # The body is only needed if the in-place patch below has to fall back
+    frontmatter, _ = parse_verse_file(verse_file, with_body=False)
     if frontmatter is None:
         return 'error'
 
-    verse_id = verse_file.stem
     already_has_context = bool(frontmatter.get('puranic_context'))
 
     if already_has_context and not regenerate:
@@ -661,30 +986,16 @@ def process_verse(
     sources = load_puranic_references(project_dir)
 
     if sources:
-        # Detect provider from _meta in index file (authoritative), fall back to embeddings JSON
-        provider = "openai"
-        for key in sources:
-            meta = load_index_meta(key, project_dir)
-            if meta and meta.get("embedding_provider"):
-                provider = meta["embedding_provider"]
-                break
-            model = load_embeddings_model(key, project_dir, embeddings_dir_override=embeddings_dir_override)
-            if model:
-                provider = provider_from_model(model)
-                break
+        if rag is None:
+            rag = load_rag_index(sources, project_dir, embeddings_dir_override=embeddings_dir_override)
+        provider = rag.provider
 
         print(f"  → {verse_id}: Embedding verse for RAG search ({len(sources)} source(s), provider: {provider})...")
         query_embedding = embed_verse_for_search(frontmatter, verse_id, project_dir, provider=provider)
 
         if query_embedding:
-            all_episodes: List[Dict] = []
-            all_embeddings: List[Dict] = []
-            for key in sources:
-                all_episodes.extend(load_episode_index(key, project_dir))
-                all_embeddings.extend(load_episode_embeddings(key, project_dir, embeddings_dir_override=embeddings_dir_override))
-
-            if all_episodes and all_embeddings:
-                retrieved_episodes = search_episodes(query_embedding, all_episodes, all_embeddings)
+            if rag.corpus is not None:
+                retrieved_episodes = rag.corpus.search(query_embedding)
                 if subject and retrieved_episodes:
                     filtered = filter_episodes_by_subject(retrieved_episodes, subject)
                     if len(filtered) < len(retrieved_episodes):
@@ -713,6 +1024,8 @@ def process_verse(
         indexed_source_names=indexed_source_names,
         subject=subject,
         subject_type=subject_type,
+        cache_dir=cache_dir,
+        refresh_cache=regenerate,
     )
 
     if entries is None:
@@ -723,20 +1036,65 @@ def process_verse(
         return 'empty'
 
     frontmatter['puranic_context'] = entries
-    if not update_verse_file(verse_file, frontmatter, body):
-        return 'error'
+    if not patch_frontmatter(verse_file, {'puranic_context': entries}, frontmatter):
+        _, body = parse_verse_file(verse_file)
+        if body is None or not update_verse_file(verse_file, frontmatter, body):
+            return 'error'
 
     action = 'regenerated' if already_has_context else 'added'
     print(f"  ✓ {verse_id}: {len(entries)} context entr{'y' if len(entries) == 1 else 'ies'} {action}")
     return action
 
 
+_verse_output = threading.local()
+
+
+class _VerseOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr while verses run in worker threads.
+
+    Writes from a thread collecting verse output are kept in that verse's
+    buffer; every other write goes straight to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        chunks = getattr(_verse_output, "chunks", None)
+        if chunks is None:
+            return self._stream.write(text)
+        chunks.append((self._stream, text))
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(_verse_output, "chunks", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _process_verse_buffered(verse_file: Path, **kwargs):
+    """Run process_verse, returning (result, output chunks, exception or None)."""
+    _verse_output.chunks = chunks = []
+    try:
+        return process_verse(verse_file, **kwargs), chunks, None
+    except Exception as e:
+        return None, chunks, e
+    finally:
+        _verse_output.chunks = None
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
 
 def main():
     """Main entry point for verse-puranic-context command."""
+    # Before building the parser, which reads PURANIC_WORKERS for its default
+    load_dotenv()
+
     parser = argparse.ArgumentParser(
         description="Generate Puranic context boxes for verse files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -759,6 +1117,7 @@ Note:
   - Uses RAG retrieval when indexed sources are available (data/puranic-references.yml)
   - Falls back to GPT-4 free recall with confirmation prompt if no sources indexed
   - Skips verses that already have puranic_context (use --regenerate to overwrite)
+  - With --all and indexed sources, verses are processed concurrently (--workers)
   - Requires OPENAI_API_KEY environment variable
         """
     )
@@ -798,6 +1157,15 @@ Note:
         type=Path,
         help="Path to embeddings config file (default: _data/embeddings.yml)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        # A string default goes through type=int, so a bad value is a usage error
+        default=os.getenv("PURANIC_WORKERS", "8"),
+        metavar="N",
+        help="Verses processed concurrently with --all when RAG sources are indexed "
+             "(default: $PURANIC_WORKERS or 8)"
+    )
 
     args = parser.parse_args()
 
@@ -824,6 +1192,12 @@ Note:
     if not os.getenv("OPENAI_API_KEY"):
         print("✗ Error: OPENAI_API_KEY environment variable not set")
         sys.exit(1)
+    try:
+        import openai  # noqa: F401  (used lazily by _get_openai_client)
+    except ImportError:
+        print("Error: openai package not installed")
+        print("Install with: pip install openai")
+        sys.exit(1)
 
     verses_dir = args.project_dir / "_verses" / args.collection
     if not verses_dir.exists():
@@ -832,7 +1206,9 @@ Note:
 
     # Determine verse files to process
     if args.all:
-        verse_files = sorted(verses_dir.glob("*.md"))
+        with os.scandir(verses_dir) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+        verse_files = [verses_dir / name for name in names]
         if not verse_files:
             print(f"✗ Error: No verse files found in {verses_dir}")
             sys.exit(1)
@@ -875,17 +1251,48 @@ Note:
 
     counts = {'added': 0, 'regenerated': 0, 'skipped': 0, 'empty': 0, 'error': 0}
 
+    verse_kwargs = dict(
+        regenerate=args.regenerate,
+        project_dir=args.project_dir,
+        subject=subject,
+        subject_type=subject_type,
+        embeddings_dir_override=puranic_dir,
+        cache_dir=args.project_dir / PURANIC_CACHE_DIR if _response_cache_enabled() else None,
+    )
+    if sources:
+        # Load the episode indexes and embeddings once rather than per verse
+        verse_kwargs["rag"] = load_rag_index(sources, args.project_dir, embeddings_dir_override=puranic_dir)
+    # Each verse waits seconds on OpenAI, so overlap them. Without indexed
+    # sources process_verse prompts for free recall, which must stay serial.
+    workers = min(args.workers, len(verse_files)) if sources else 1
+
     try:
-        for verse_file in verse_files:
-            result = process_verse(
-                verse_file,
-                regenerate=args.regenerate,
-                project_dir=args.project_dir,
-                subject=subject,
-                subject_type=subject_type,
-                embeddings_dir_override=puranic_dir,
-            )
-            counts[result] = counts.get(result, 0) + 1
+        if workers > 1:
+            # Buffer each verse's output and print it in one piece when the
+            # verse finishes, so lines from concurrent verses don't interleave.
+            real_streams = sys.stdout, sys.stderr
+            sys.stdout, sys.stderr = _VerseOutput(sys.stdout), _VerseOutput(sys.stderr)
+            executor = ThreadPoolExecutor(max_workers=workers)
+            futures = []
+            try:
+                futures = [executor.submit(_process_verse_buffered, vf, **verse_kwargs) for vf in verse_files]
+                for future in as_completed(futures):
+                    result, chunks, exc = future.result()
+                    for stream, text in chunks:
+                        stream.write(text)
+                    if exc is not None:
+                        raise exc
+                    counts[result] = counts.get(result, 0) + 1
+            finally:
+                # shutdown(cancel_futures=True) needs Python 3.9
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
+                sys.stdout, sys.stderr = real_streams
+        else:
+            for verse_file in verse_files:
+                result = process_verse(verse_file, **verse_kwargs)
+                counts[result] = counts.get(result, 0) + 1
     except KeyboardInterrupt:
         print("\n\n⚠ Interrupted by user")
         sys.exit(1)
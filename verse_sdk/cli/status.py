@@ -31,15 +31,23 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import os
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import yaml
+from verse_sdk.utils.file_utils import read_json
+
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
 
 try:
     from dotenv import load_dotenv
@@ -48,9 +56,6 @@ except ImportError:
     print("Install with: pip install python-dotenv")
     sys.exit(1)
 
-# Load environment variables
-load_dotenv()
-
 
 def get_file_info(file_path: Path) -> Optional[Dict]:
     """Get file metadata if it exists."""
@@ -66,21 +71,73 @@ def get_file_info(file_path: Path) -> Optional[Dict]:
     }
 
 
-def parse_verse_frontmatter(verse_file: Path) -> Dict:
-    """Parse YAML frontmatter from verse markdown file."""
-    if not verse_file.exists():
+# Image themes checked for every verse, in images/<collection>/<theme>/
+IMAGE_THEMES = ['modern-minimalist', 'traditional', 'kids-friendly', 'devotional']
+
+
+def _scan_dir(path: Path) -> Dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects for one directory ({} if it can't be read)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
         return {}
 
+
+def scan_collection_dirs(collection: str, project_dir: Path) -> Dict[str, Dict[str, os.DirEntry]]:
+    """
+    List the verse, audio and image directories of a collection once.
+
+    check_verse_status() looks files up in the result instead of calling
+    exists()/stat() for every candidate file of every verse.
+    """
+    return {key: _scan_dir(path) for key, path in _collection_dirs(collection, project_dir).items()}
+
+
+def _collection_dirs(collection: str, project_dir: Path) -> Dict[str, Path]:
+    """Directories holding a collection's verses, audio and (per-theme) images."""
+    images_dir = project_dir / "images" / collection
+    dirs = {
+        'verses': project_dir / "_verses" / collection,
+        'audio': project_dir / "audio" / collection,
+        'images': images_dir,
+    }
+    for theme in IMAGE_THEMES:
+        dirs[theme] = images_dir / theme
+    return dirs
+
+
+def _entry_info(entry: Optional[os.DirEntry]) -> Optional[Dict]:
+    """Same as get_file_info() for a scanned directory entry."""
+    if entry is None:
+        return None
+
+    try:
+        return _stat_info(entry.path, entry.stat())
+    except OSError:
+        return None  # e.g. a broken symlink, which exists() also reports as missing
+
+
+def _stat_info(path: str, stat: os.stat_result) -> Dict:
+    """get_file_info() result built from an existing stat() result."""
+    return {
+        'exists': True,
+        'size': stat.st_size,
+        'modified': datetime.fromtimestamp(stat.st_mtime),
+        'path': path
+    }
+
+
+def parse_verse_frontmatter(verse_file: Path, verse_stat: Optional[os.stat_result] = None) -> Dict:
+    """Parse YAML frontmatter from verse markdown file (verse_stat skips a stat() call)."""
+    # PyYAML is imported on first use so --help and --embeddings-only skip it
+    from verse_sdk.utils.yaml_parser import extract_yaml_frontmatter
+
     try:
-        with open(verse_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Extract frontmatter between --- markers
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                frontmatter = yaml.safe_load(parts[1])
-                return frontmatter or {}
+        # Reads only up to the closing --- marker, not the verse body
+        return extract_yaml_frontmatter(verse_file, verse_stat) or {}
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         print(f"Warning: Could not parse {verse_file}: {e}", file=sys.stderr)
 
@@ -89,6 +146,8 @@ def parse_verse_frontmatter(verse_file: Path) -> Dict:
 
 def load_normative_verses(collection: str, project_dir: Path) -> Dict:
     """Load normative verses from data/verses/{collection}.yaml or .yml"""
+    from verse_sdk.utils.yaml_parser import load_yaml_file
+
     # Try .yaml first, then .yml
     verses_file = project_dir / "data" / "verses" / f"{collection}.yaml"
     if not verses_file.exists():
@@ -98,8 +157,7 @@ def load_normative_verses(collection: str, project_dir: Path) -> Dict:
         return {}
 
     try:
-        with open(verses_file, 'r', encoding='utf-8') as f:
-            verses_data = yaml.safe_load(f)
+        verses_data = load_yaml_file(verses_file)
 
         # Filter out metadata keys (starting with _)
         if verses_data:
@@ -217,42 +275,63 @@ def check_verse_status(
     verse_file: Path,
     project_dir: Path,
     normative_verses: Optional[Dict] = None,
-    validate_text: bool = False
+    validate_text: bool = False,
+    dir_entries: Optional[Dict[str, Dict[str, os.DirEntry]]] = None
 ) -> Dict:
-    """Check status of a single verse."""
+    """
+    Check status of a single verse.
+
+    Pass the scan_collection_dirs() result as dir_entries when checking many
+    verses of one collection; otherwise only this verse's candidate files are
+    stat()ed.
+    """
     verse_id = verse_file.stem  # Remove .md extension
 
-    # Parse frontmatter
-    frontmatter = parse_verse_frontmatter(verse_file)
+    if dir_entries is None:
+        collection_dirs = _collection_dirs(collection, project_dir)
+
+        def file_info(key: str, name: str) -> Optional[Dict]:
+            return get_file_info(collection_dirs[key] / name)
 
-    # Check audio files
-    audio_dir = project_dir / "audio" / collection
-    audio_full = audio_dir / f"{verse_id}-full.mp3"
-    audio_slow = audio_dir / f"{verse_id}-slow.mp3"
+        verse_entry = None
+    else:
+        def file_info(key: str, name: str) -> Optional[Dict]:
+            return _entry_info(dir_entries[key].get(name))
+
+        verse_entry = dir_entries['verses'].get(verse_file.name)
+        if verse_entry is not None and verse_entry.path != str(verse_file):
+            verse_entry = None  # verse_file lives outside _verses/<collection>
+
+    # One stat() serves both the frontmatter cache key and the file info
+    try:
+        verse_stat = verse_entry.stat() if verse_entry is not None else os.stat(verse_file)
+    except OSError:
+        verse_stat = None
+
+    # Parse frontmatter
+    frontmatter = parse_verse_frontmatter(verse_file, verse_stat) if verse_stat is not None else {}
 
     # Check image files (check common themes)
-    images_dir = project_dir / "images" / collection
-    themes = ['modern-minimalist', 'traditional', 'kids-friendly', 'devotional']
+    image_name = f"{verse_id}.png"
     image_files = {}
 
-    for theme in themes:
-        theme_dir = images_dir / theme
-        img_file = theme_dir / f"{verse_id}.png"
-        if img_file.exists():
-            image_files[theme] = get_file_info(img_file)
+    for theme in IMAGE_THEMES:
+        img_info = file_info(theme, image_name)
+        if img_info is not None:
+            image_files[theme] = img_info
 
     # Default theme image
-    default_image = images_dir / f"{verse_id}.png"
-    if default_image.exists():
-        image_files['default'] = get_file_info(default_image)
+    default_image = file_info('images', image_name)
+    if default_image is not None:
+        image_files['default'] = default_image
 
     result = {
         'verse_id': verse_id,
-        'verse_file': get_file_info(verse_file),
+        'verse_file': _stat_info(str(verse_file), verse_stat) if verse_stat is not None else None,
         'frontmatter': frontmatter,
         'audio': {
-            'full': get_file_info(audio_full),
-            'slow': get_file_info(audio_slow)
+            'full': file_info('audio', f"{verse_id}-full.mp3"),
+            'slow': file_info('audio', f"{verse_id}-slow.mp3")
         },
         'images': image_files,
         'has_devanagari': bool(frontmatter.get('devanagari')),
@@ -276,8 +355,7 @@ def check_embeddings_status(project_dir: Path) -> Dict:
 
     if manifest_file.exists():
         try:
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+            manifest = read_json(manifest_file)
 
             collection_counts = {}
             total = 0
@@ -309,28 +387,27 @@ def check_embeddings_status(project_dir: Path) -> Dict:
         }
 
     try:
-        with open(legacy_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Legacy files hold every vector and can be tens of MB; orjson parses them much faster
+        data = read_json(legacy_file)
 
-        collection_counts = defaultdict(int)
+        collection_counts = Counter()
         verse_count = 0
 
         if isinstance(data, list):
-            for item in data:
-                collection = item.get('collection', 'unknown')
-                collection_counts[collection] += 1
+            collection_counts.update(item.get('collection', 'unknown') for item in data)
             verse_count = len(data)
         elif isinstance(data, dict):
             verses = data.get('verses')
             if isinstance(verses, dict):
                 verse_count = len(verses.get('en', []))
-                for item in verses.get('en', []):
-                    collection = item.get('metadata', {}).get('collection_key', 'unknown')
-                    collection_counts[collection] += 1
+                collection_counts.update(
+                    item.get('metadata', {}).get('collection_key', 'unknown')
+                    for item in verses.get('en', [])
+                )
             elif isinstance(data.get('embeddings'), list):
-                for item in data.get('embeddings', []):
-                    collection = item.get('collection', 'unknown')
-                    collection_counts[collection] += 1
+                collection_counts.update(
+                    item.get('collection', 'unknown') for item in data.get('embeddings', [])
+                )
                 verse_count = len(data.get('embeddings', []))
 
         return {
@@ -349,14 +426,15 @@ def check_embeddings_status(project_dir: Path) -> Dict:
 
 def get_enabled_collections(project_dir: Path) -> List[Tuple[str, Dict]]:
     """Get list of enabled collections from collections.yml"""
+    from verse_sdk.utils.yaml_parser import load_yaml_file
+
     collections_file = project_dir / "_data" / "collections.yml"
 
     if not collections_file.exists():
         return []
 
     try:
-        with open(collections_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml_file(collections_file)
 
         enabled = [
             (key, info)
@@ -373,9 +451,15 @@ def analyze_collection(
     collection: str,
     project_dir: Path,
     validate_text: bool = False,
-    specific_verse: Optional[str] = None
+    specific_verse: Optional[str] = None,
+    workers: int = 8
 ) -> Dict:
-    """Analyze a single collection."""
+    """
+    Analyze a single collection.
+
+    Verses are checked on up to ``workers`` threads, since the work is
+    mostly waiting on file reads; results keep the sorted verse order.
+    """
     verses_dir = project_dir / "_verses" / collection
 
     if not verses_dir.exists():
@@ -408,7 +492,19 @@ def analyze_collection(
         verse_files = [verse_file]
     else:
         # Check all verses
-        verse_files = sorted(verses_dir.glob("*.md"))
+        verse_files = None
+
+    # One directory listing per folder instead of several stat() calls per verse;
+    # a single verse only needs its own handful of candidate files stat()ed
+    dir_entries = None
+    if verse_files is None:
+        dir_entries = scan_collection_dirs(collection, project_dir)
+        # is_file() answers from the cached dirent type, so this adds no stat() calls
+        verse_files = [
+            verses_dir / name
+            for name, entry in sorted(dir_entries['verses'].items())
+            if name.endswith(".md") and entry.is_file()
+        ]
 
     if not verse_files:
         return {
@@ -419,32 +515,41 @@ def analyze_collection(
         }
 
     # Analyze each verse
-    verses = []
-    for verse_file in verse_files:
-        status = check_verse_status(
+    def check(verse_file: Path) -> Dict:
+        return check_verse_status(
             collection,
             verse_file,
             project_dir,
             normative_verses=normative_verses,
-            validate_text=validate_text
+            validate_text=validate_text,
+            dir_entries=dir_entries
         )
-        verses.append(status)
 
-    # Calculate statistics
-    total_verses = len(verses)
-    verses_with_audio_full = sum(1 for v in verses if v['audio']['full'])
-    verses_with_audio_slow = sum(1 for v in verses if v['audio']['slow'])
-    verses_with_images = sum(1 for v in verses if v['images'])
-    verses_with_devanagari = sum(1 for v in verses if v['has_devanagari'])
-    verses_with_translation = sum(1 for v in verses if v['has_translation'])
+    if len(verse_files) < 2 or workers <= 1:
+        verses = [check(verse_file) for verse_file in verse_files]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(verse_files))) as pool:
+            verses = list(pool.map(check, verse_files))
 
-    # Calculate completion percentage
+    # Calculate statistics in one pass over the verses
+    total_verses = len(verses)
+    verses_with_audio_full = verses_with_audio_slow = verses_with_images = 0
+    verses_with_devanagari = verses_with_translation = 0
     # Full completion = verse file + both audios + at least one image + devanagari + translation
-    fully_complete = sum(
-        1 for v in verses
-        if v['audio']['full'] and v['audio']['slow'] and v['images']
-        and v['has_devanagari'] and v['has_translation']
-    )
+    fully_complete = 0
+    for v in verses:
+        audio = v['audio']
+        has_full = bool(audio['full'])
+        has_slow = bool(audio['slow'])
+        has_images = bool(v['images'])
+        has_devanagari = v['has_devanagari']
+        has_translation = v['has_translation']
+        verses_with_audio_full += has_full
+        verses_with_audio_slow += has_slow
+        verses_with_images += has_images
+        verses_with_devanagari += has_devanagari
+        verses_with_translation += has_translation
+        fully_complete += has_full and has_slow and has_images and has_devanagari and has_translation
 
     completion_percentage = (fully_complete / total_verses * 100) if total_verses > 0 else 0
 
@@ -465,13 +570,43 @@ def analyze_collection(
     }
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    i = min(4, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
+
+
+def print_json(data) -> None:
+    """
+    Print data as indented JSON; values JSON can't represent (datetimes) use str().
+
+    orjson is used when installed. It writes non-ASCII text as UTF-8 rather
+    than \\u escapes, which parses to the same data.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+        else:
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                # Text-only stdout, e.g. io.StringIO under redirect_stdout
+                sys.stdout.write(encoded.decode("utf-8") + "\n")
+                return
+            sys.stdout.flush()
+            buffer.write(encoded + b"\n")
+            buffer.flush()
+            return
+    print(json.dumps(data, indent=2, default=str))
 
 
 def print_collection_status(analysis: Dict, detailed: bool = False, show_validation: bool = False):
@@ -555,6 +690,7 @@ def print_collection_status(analysis: Dict, detailed: bool = False, show_validat
 
     if detailed and not show_validation:
         print("\n   Verse Details:")
+        lines = []
         for verse in analysis['verses']:
             verse_id = verse['verse_id']
             audio_full = "✓" if verse['audio']['full'] else "✗"
@@ -562,7 +698,7 @@ def print_collection_status(analysis: Dict, detailed: bool = False, show_validat
             images = "✓" if verse['images'] else "✗"
             devanagari = "✓" if verse['has_devanagari'] else "✗"
 
-            print(f"   ├─ {verse_id:20s} │ Text:{devanagari} │ Audio:{audio_full}{audio_slow} │ Image:{images}")
+            lines.append(f"   ├─ {verse_id:20s} │ Text:{devanagari} │ Audio:{audio_full}{audio_slow} │ Image:{images}")
 
             # Show missing content
             missing = []
@@ -576,7 +712,10 @@ def print_collection_status(analysis: Dict, detailed: bool = False, show_validat
                 missing.append("images")
 
             if missing:
-                print(f"   │  └─ Missing: {', '.join(missing)}")
+                lines.append(f"   │  └─ Missing: {', '.join(missing)}")
+
+        if lines:
+            print("\n".join(lines))
 
 
 def print_embeddings_status(embeddings: Dict):
@@ -630,6 +769,9 @@ def print_summary(analyses: List[Dict], embeddings: Dict):
 
 def main():
     """Main entry point."""
+    # Load environment variables
+    load_dotenv()
+
     parser = argparse.ArgumentParser(
         description="Check status of verse collections",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -719,7 +861,7 @@ Examples:
 
     if args.embeddings_only:
         if args.format == 'json':
-            print(json.dumps(embeddings, indent=2, default=str))
+            print_json(embeddings)
         else:
             print_embeddings_status(embeddings)
         sys.exit(0)
@@ -739,16 +881,17 @@ Examples:
         print("No collections found to check")
         sys.exit(1)
 
-    # Analyze collections
-    analyses = []
-    for collection in collections_to_check:
-        analysis = analyze_collection(
+    # Analyze collections side by side; map() keeps them in the requested order
+    def analyze(collection: str) -> Dict:
+        return analyze_collection(
             collection,
             project_dir,
             validate_text=args.validate_text,
             specific_verse=args.verse
         )
-        analyses.append(analysis)
+
+    with ThreadPoolExecutor(max_workers=min(4, len(collections_to_check))) as pool:
+        analyses = list(pool.map(analyze, collections_to_check))
 
     # Output results
     if args.format == 'json':
@@ -756,29 +899,34 @@ Examples:
             'collections': analyses,
             'embeddings': embeddings
         }
-        print(json.dumps(output, indent=2, default=str))
+        print_json(output)
     else:
-        # Print header
-        print("\n" + "="*60)
-        print("VERSE COLLECTION STATUS")
-        print("="*60)
-
-        # Print each collection
-        for analysis in analyses:
-            print_collection_status(
-                analysis,
-                detailed=args.detailed,
-                show_validation=args.validate_text
-            )
-
-        # Print embeddings status
-        print_embeddings_status(embeddings)
+        # Collect the report in memory and write it once; --detailed prints
+        # several lines per verse and each print() is a separate write
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            # Print header
+            print("\n" + "="*60)
+            print("VERSE COLLECTION STATUS")
+            print("="*60)
+
+            # Print each collection
+            for analysis in analyses:
+                print_collection_status(
+                    analysis,
+                    detailed=args.detailed,
+                    show_validation=args.validate_text
+                )
+
+            # Print embeddings status
+            print_embeddings_status(embeddings)
 
-        # Print summary if multiple collections
-        if len(analyses) > 1:
-            print_summary(analyses, embeddings)
+            # Print summary if multiple collections
+            if len(analyses) > 1:
+                print_summary(analyses, embeddings)
 
-        print()
+            print()
+        sys.stdout.write(buf.getvalue())
 
 
 if __name__ == '__main__':
@@ -16,6 +16,7 @@ Usage as script:
 """
 
 import argparse
+import functools
 import hashlib
 import json
 import os
@@ -24,13 +25,12 @@ import time
 from datetime import datetime
 from pathlib import Path
 
-import yaml
-
 from verse_sdk.utils.embeddings_config import (
     get_provider_config,
     load_embeddings_config,
     resolve_with_precedence,
 )
+from verse_sdk.utils.yaml_parser import extract_yaml_frontmatter, load_yaml_file
 
 try:
     from dotenv import load_dotenv
@@ -177,30 +177,72 @@ def initialize_provider(provider_name, model_override=None):
         sys.exit(1)
 
 
-def extract_yaml_frontmatter(file_path):
-    """Extract YAML front matter from markdown file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def _collections_sidecar_enabled():
+    """The JSON sidecar is opt-in, since it writes a file into the project."""
+    return os.getenv('EMBEDDINGS_COLLECTIONS_CACHE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _collections_sidecar_path(path):
+    """Hidden JSON cache next to collections.yml (dotfiles are skipped by Jekyll)."""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.json")
+
 
-    if not content.startswith('---'):
+def _read_collections_sidecar(path, mtime_ns, size):
+    """Return cached collections data if the sidecar matches this snapshot, else None."""
+    try:
+        with open(_collections_sidecar_path(path), 'rb') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
         return None
 
-    end_idx = content.find('---', 3)
-    if end_idx == -1:
+    if not isinstance(cached, dict):
+        return None
+    if cached.get('mtime_ns') != mtime_ns or cached.get('size') != size:
         return None
+    return cached.get('data')
 
-    yaml_content = content[3:end_idx].strip()
-    return yaml.safe_load(yaml_content)
+
+def _write_collections_sidecar(path, mtime_ns, size, data):
+    """Best-effort write of the JSON sidecar; skipped if data doesn't survive JSON."""
+    try:
+        payload = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'data': data}, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    # YAML-only types (dates, non-string keys) would come back different
+    if json.loads(payload)['data'] != data:
+        return
+
+    sidecar = _collections_sidecar_path(path)
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp, sidecar)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 
 def load_collections_config(collections_file):
     """Load collections configuration from YAML file."""
-    if not collections_file.exists():
+    collections_file = Path(collections_file)
+    if not collections_file.is_file():
         print(f"Error: Collections file not found: {collections_file}")
         sys.exit(1)
 
-    with open(collections_file, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    if not _collections_sidecar_enabled():
+        return load_yaml_file(collections_file)
+
+    path = str(collections_file.resolve())
+    stat = collections_file.stat()
+    config = _read_collections_sidecar(path, stat.st_mtime_ns, stat.st_size)
+    if config is None:
+        config = load_yaml_file(collections_file)
+        _write_collections_sidecar(path, stat.st_mtime_ns, stat.st_size, config)
+    return config
 
 
 def get_enabled_collections(collections_config):
@@ -361,9 +403,18 @@ def extract_permalink_from_frontmatter(verse_data):
 def generate_verse_url(verse_data):
     """Generate URL path for verse page."""
     verse_num = verse_data.get('verse_number', 0)
+    title_en = verse_data.get('title_en', '')
+    try:
+        return _verse_url(verse_num, title_en)
+    except TypeError:
+        # Unhashable front matter values bypass the cache
+        return _verse_url.__wrapped__(verse_num, title_en)
 
+
+@functools.lru_cache(maxsize=4096)
+def _verse_url(verse_num, title_en):
+    """Build the verse URL from the only two front matter fields it depends on."""
     # Handle special cases (dohas, closing verses)
-    title_en = verse_data.get('title_en', '')
     if 'Doha' in title_en:
         if 'Opening' in title_en or verse_num == 1 or verse_num == '1':
             return '/verses/doha-01/'
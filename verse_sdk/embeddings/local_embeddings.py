@@ -98,16 +98,15 @@ class LocalEmbeddingGenerator:
 
         self.load_model()
 
-        verse_files = file_utils.find_markdown_files(verses_dir, file_pattern)
-        print(f"Found {len(verse_files)} verse files\n")
+        verse_entries = file_utils.load_all_frontmatter(verses_dir, file_pattern)
+        print(f"Found {len(verse_entries)} verse files\n")
 
         # Collect results for each language
         results = {lang: [] for lang in languages}
 
-        for verse_file in verse_files:
+        for verse_file, verse_data in verse_entries:
             print(f"Processing {verse_file.name}...")
 
-            verse_data = yaml_parser.extract_yaml_frontmatter(verse_file)
             if not verse_data:
                 print(f"  Warning: Could not extract YAML from {verse_file.name}")
                 continue
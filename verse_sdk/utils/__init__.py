@@ -1,5 +1,14 @@
 """Utility modules for verse content processing."""
 
-from . import credentials, file_utils, yaml_parser
+import importlib
 
 __all__ = ["yaml_parser", "file_utils", "credentials"]
+
+
+def __getattr__(name):
+    # Import submodules on first access so commands only pay for what they use
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
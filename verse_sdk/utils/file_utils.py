@@ -1,9 +1,17 @@
 """File handling utilities."""
 
+import fnmatch
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # optional, faster JSON decoding
+except ImportError:
+    orjson = None
 
 
 def ensure_directory(path: Path) -> None:
@@ -44,8 +52,14 @@ def read_json(file_path: Path) -> Any:
     Returns:
         Parsed JSON data
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity, which only the stdlib parser accepts
+    return json.loads(raw.decode('utf-8'))
 
 
 def find_markdown_files(directory: Path, pattern: str = "*.md") -> List[Path]:
@@ -59,7 +73,44 @@ def find_markdown_files(directory: Path, pattern: str = "*.md") -> List[Path]:
     Returns:
         Sorted list of Path objects
     """
-    return sorted(directory.glob(pattern))
+    if "/" in pattern or "**" in pattern:
+        return sorted(directory.glob(pattern))
+
+    # Single-level patterns: one readdir, no per-entry stat
+    try:
+        with os.scandir(directory) as entries:
+            names = [e.name for e in entries if fnmatch.fnmatch(e.name, pattern)]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return sorted(directory / name for name in names)
+
+
+def load_all_frontmatter(
+    directory: Path, pattern: str = "*.md", workers: int = 8
+) -> List[Tuple[Path, Optional[Dict[str, Any]]]]:
+    """
+    Read the YAML front matter of every markdown file in a directory.
+
+    Files are parsed on a thread pool, since the work is mostly waiting
+    on disk reads.
+
+    Args:
+        directory: Directory to search
+        pattern: Glob pattern for matching files
+        workers: Maximum number of reader threads
+
+    Returns:
+        List of (path, front matter) pairs in find_markdown_files order;
+        the front matter is None for files without any
+    """
+    # Imported here so file_utils users don't pull in PyYAML
+    from .yaml_parser import extract_yaml_frontmatter
+
+    files = find_markdown_files(directory, pattern)
+    if len(files) < 2 or workers <= 1:
+        return [(f, extract_yaml_frontmatter(f)) for f in files]
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        return list(zip(files, pool.map(extract_yaml_frontmatter, files)))
 
 
 def get_file_size_kb(file_path: Path) -> float:
@@ -1,33 +1,136 @@
 """YAML front matter parsing utilities."""
 
+import copy
+import functools
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
 
-def extract_yaml_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
+
+# Read size when scanning for the closing front matter delimiter
+_FRONTMATTER_CHUNK = 4096
+
+
+def load_yaml(stream: Any) -> Any:
     """
-    Extract YAML front matter from a markdown file.
+    Parse YAML like yaml.safe_load, using the libyaml C loader when available.
 
     Args:
-        file_path: Path to the markdown file
+        stream: YAML string, bytes, or open file object
 
     Returns:
-        Dictionary containing the YAML data, or None if no front matter found
+        The parsed YAML document
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """
+    Serialize data like yaml.safe_dump, using the libyaml C emitter when available.
+
+    libyaml escapes characters outside the Basic Multilingual Plane (emoji such
+    as 🙏) even with allow_unicode, so such output is re-emitted with the pure
+    Python dumper to keep it identical to yaml.safe_dump.
+
+    Args:
+        data: Data to serialize
+        stream: Optional open file object to write to
+        **kwargs: Emitter options such as allow_unicode or sort_keys
+
+    Returns:
+        The YAML text when no stream is given, otherwise None
+    """
+    text = yaml.dump(data, Dumper=SafeDumper, **kwargs)
+    if kwargs.get('allow_unicode') and SafeDumper is not yaml.SafeDumper:
+        escape = '\\U' if isinstance(text, str) else b'\\U'
+        if escape in text:
+            text = yaml.dump(data, Dumper=yaml.SafeDumper, **kwargs)
+    if stream is None:
+        return text
+    stream.write(text)
+    return None
+
+
+def load_yaml_file(file_path: Path, copy_result: bool = True) -> Any:
+    """
+    Load a YAML file, caching the parse per (path, mtime, size).
+
+    Re-reading an unchanged file skips the YAML parse, and an edited file is
+    parsed again because its snapshot changes.
+
+    Args:
+        file_path: Path to the YAML file
+        copy_result: Return a fresh copy the caller may mutate; pass False
+            only when the result is read and never modified
+
+    Returns:
+        The parsed YAML document (None for an empty file)
+
+    Raises:
+        OSError: If the file cannot be read
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    st = os.stat(file_path)
+    data = _parse_yaml_file(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(data) if copy_result else data
+
 
-    if not content.startswith('---'):
-        return None
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse one snapshot of a YAML file (see load_yaml_file)."""
+    with open(path, encoding='utf-8') as f:
+        return load_yaml(f)
 
-    end_idx = content.find('---', 3)
-    if end_idx == -1:
-        return None
 
-    yaml_content = content[3:end_idx].strip()
-    return yaml.safe_load(yaml_content)
+def extract_yaml_frontmatter(
+    file_path: Path, stat_result: Optional[os.stat_result] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract YAML front matter from a markdown file.
+
+    Parsed results are cached per (path, mtime, size), so re-reading an
+    unchanged file skips the YAML parse. Each call returns a fresh copy.
+
+    Args:
+        file_path: Path to the markdown file
+        stat_result: os.stat() result for file_path, if the caller already has one
+
+    Returns:
+        Dictionary containing the YAML data, or None if no front matter found
+    """
+    st = stat_result if stat_result is not None else os.stat(file_path)
+    data = _parse_frontmatter(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_frontmatter(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parse front matter for one snapshot of a file (see extract_yaml_frontmatter)."""
+    # Read in chunks and stop at the closing delimiter instead of loading the body
+    with open(path, 'rb') as f:
+        buf = f.read(_FRONTMATTER_CHUNK)
+        if not buf.startswith(b'---'):
+            return None
+
+        end_idx = buf.find(b'---', 3)
+        while end_idx == -1:
+            chunk = f.read(_FRONTMATTER_CHUNK)
+            if not chunk:
+                return None
+            # Back up two bytes so a delimiter split across chunks is still found
+            start = max(3, len(buf) - 2)
+            buf += chunk
+            end_idx = buf.find(b'---', start)
+
+    yaml_content = buf[3:end_idx].decode('utf-8').strip()
+    return load_yaml(yaml_content)
 
 
 def get_nested_value(data: Dict[str, Any], key: str, lang: Optional[str] = None, default: Any = None) -> Any: